@@ -5,6 +5,7 @@ Commands:
 - sync-schedule  : Populate the current season's NFL schedule (weeks 1–18), called once
 - sync-scores    : Update scores & status for a specific week, called while games are live
 - sync-kickoffs  : Refresh kickoff times for a specific week, called infrequently
+- sync-all       : sync-scores then sync-kickoffs for a week
 - reset-season   : Archive picks, wipe games/picks, reset season status, sync new schedule
 - list-leagues   : Show all tenants with member/player counts
 - validate-rosters : Read-only roster integrity checks across one or all tenants
@@ -19,6 +20,7 @@ Example usage:
 - python -m backend.cli sync-schedule
 - python -m backend.cli sync-scores 6
 - python -m backend.cli sync-kickoffs 6
+- python -m backend.cli sync-all 6
 - python -m backend.cli import-picks-xlsx C:/path/to/picks.xlsx --week 6
 - python -m backend.cli import-picks-xlsx C:/path/to/picks.xlsx --max-week 6
 - python -m backend.cli reset-season --year 2024
@@ -40,45 +42,51 @@ import os
 import sys
 from collections.abc import Awaitable, Callable
 from contextlib import nullcontext, redirect_stdout
-from typing import Any, NoReturn
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NoReturn
 
 import psycopg
-from passlib.hash import (
-    bcrypt as _bcrypt,  # pyright: ignore[reportAttributeAccessIssue]
-)
-from sqlalchemy import text
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 # Settings currently announce loaded env files on stdout during imports.  Keep
 # stdout machine-readable for `validate-rosters --json` by sending only those
 # import-time diagnostics to stderr for that invocation.
 _json_validation_mode = "validate-rosters" in sys.argv and "--json" in sys.argv
 with redirect_stdout(sys.stderr) if _json_validation_mode else nullcontext():
-    from backend.routes.auth import make_session_token
-    from backend.utils.db import AsyncSessionLocal
     from backend.utils.roster_validation import (
         format_roster_validation_report,
         validate_rosters,
     )
-    from backend.utils.scheduled_jobs import (
-        get_all_player_emails,
-        run_email_mon,
-        run_email_sun,
-        run_email_tue_warn,
-        run_kickoff_sync,
-        run_poll_scores,
-    )
-    from backend.utils.score_sync import ScoreSync
     from backend.utils.settings import get_settings
-from .utils.import_picks_xlsx import import_picks_pivot_xlsx
 
-# Mapping of scheduled job names to their runner functions
-_JOBS: dict[str, Callable[[Any], Awaitable[dict[str, Any]]]] = {
-    "kickoff_sync": run_kickoff_sync,
-    "score_sync": run_poll_scores,
-    "email_sun": run_email_sun,
-    "email_mon": run_email_mon,
-    "email_tue_warn": run_email_tue_warn,
-}
+
+_JOB_NAMES = ["kickoff_sync", "score_sync", "email_sun", "email_mon", "email_tue_warn"]
+
+
+def _job_runner(job: str) -> Callable[[Any], Awaitable[dict[str, Any]]] | None:
+    """Return the runner for a scheduled job name, importing only that runner."""
+    # pylint: disable=import-outside-toplevel
+    match job:
+        case "kickoff_sync":
+            from backend.utils.scheduled_jobs import run_kickoff_sync
+            return run_kickoff_sync
+        case "score_sync":
+            from backend.utils.scheduled_jobs import run_poll_scores
+            return run_poll_scores
+        case "email_sun":
+            from backend.utils.scheduled_jobs import run_email_sun
+            return run_email_sun
+        case "email_mon":
+            from backend.utils.scheduled_jobs import run_email_mon
+            return run_email_mon
+        case "email_tue_warn":
+            from backend.utils.scheduled_jobs import run_email_tue_warn
+            return run_email_tue_warn
+        case _:
+            return None
+
 
 class _HelpOnErrorParser(argparse.ArgumentParser):
     """ArgumentParser that prints the full help text on errors for a friendlier UX."""
@@ -87,12 +95,28 @@ class _HelpOnErrorParser(argparse.ArgumentParser):
         self.exit(2, f"\nerror: {message}\n")
 
 
-def get_connection(cfg: dict[str, Any]) -> psycopg.Connection:
-    """Open a psycopg connection and set session TZ to UTC."""
-    conn = psycopg.connect(**cfg)  # pylint: disable=no-member
-    with conn.cursor() as cur:     # pylint: disable=no-member
-        cur.execute("SET TIME ZONE 'UTC';")
-    return conn
+@lru_cache(maxsize=1)
+def _cfg() -> dict[str, Any]:
+    """psycopg connection kwargs for this process, built once from settings."""
+    return get_settings().psycopg_kwargs()
+
+
+def get_connection() -> psycopg.Connection:
+    """
+    Open a psycopg connection with session TZ set to UTC.
+    Each command opens one; as a context manager it commits on success and rolls back on error.
+    """
+    # Startup option instead of a SET TIME ZONE round-trip
+    return psycopg.connect(**_cfg(), options="-c TimeZone=UTC")  # pylint: disable=no-member
+
+
+def _async_session() -> AsyncSession:
+    """
+    New AsyncSessionLocal() session. Imported on first use so the sync (psycopg-only)
+    commands and --help don't pay for loading SQLAlchemy's async engine.
+    """
+    from backend.utils.db import AsyncSessionLocal  # pylint: disable=import-outside-toplevel
+    return AsyncSessionLocal()
 
 
 # -----------------------------------------------------------------------------
@@ -103,8 +127,9 @@ async def cmd_load_schedule(_: argparse.Namespace) -> int:
     Populate/refresh the current season's schedule (weeks 1–18).
     Uses async SQLAlchemy session.
     """
+    from backend.utils.score_sync import ScoreSync  # pylint: disable=import-outside-toplevel
     print("[cli] sync-schedule (async SQLAlchemy)")
-    async with AsyncSessionLocal() as session:
+    async with _async_session() as session:
         sync = ScoreSync(session)
         changed = await sync.load_schedule()
         print(f"[cli] sync-schedule: upserted {changed} game rows.")
@@ -115,9 +140,24 @@ async def cmd_sync_scores(args: argparse.Namespace) -> int:
     """
     Update scores & status for the given week using ScoreSync.sync_scores_and_status(week).
     """
+    from sqlalchemy import text  # pylint: disable=import-outside-toplevel
+
+    from backend.utils.score_sync import ScoreSync  # pylint: disable=import-outside-toplevel
     week = _validated_week(args.week)
     print(f"[cli] sync-scores {week} (async SQLAlchemy)")
-    async with AsyncSessionLocal() as session:
+    async with _async_session() as session:
+        if not getattr(args, "force", False):
+            # Skip the ESPN fetch when nothing in the week is live or about to kick off
+            res = await session.execute(text("""
+                SELECT 1 FROM games
+                 WHERE week_number = :w
+                   AND status IN ('in_progress', 'scheduled')
+                   AND kickoff_at <= now() + interval '15 minutes'
+                 LIMIT 1
+            """), {"w": week})
+            if res.first() is None:
+                print("[cli] sync-scores: no live/upcoming games; nothing to do (use --force to sync anyway).")
+                return 0
         sync = ScoreSync(session)
         updated = await sync.sync_scores_and_status(week)
         print(f"[cli] sync-scores: updated {updated} game rows.")
@@ -128,14 +168,31 @@ async def cmd_sync_kickoffs(args: argparse.Namespace) -> int:
     """
     Refresh kickoff times for the given week using ScoreSync.refresh_kickoffs(week).
     """
+    from backend.utils.score_sync import ScoreSync  # pylint: disable=import-outside-toplevel
     week = _validated_week(args.week)
     print(f"[cli] sync-kickoffs {week} (async SQLAlchemy)")
-    async with AsyncSessionLocal() as session:
+    async with _async_session() as session:
         sync = ScoreSync(session)
         updates = await sync.refresh_kickoffs(week)
         print(f"[cli] sync-kickoffs: updated kickoff_at for {updates} game rows.")
     return 0
 
+async def cmd_sync_all(args: argparse.Namespace) -> int:
+    """
+    Sync scores/status, then refresh kickoff times, for the given week on one session.
+    Run one after the other: both update the same games rows and commit only at the end,
+    so concurrent sessions could block or deadlock on each other's row locks.
+    """
+    from backend.utils.score_sync import ScoreSync  # pylint: disable=import-outside-toplevel
+    week = _validated_week(args.week)
+    print(f"[cli] sync-all {week} (async SQLAlchemy)")
+    async with _async_session() as session:
+        sync = ScoreSync(session)
+        updated = await sync.sync_scores_and_status(week)
+        updates = await sync.refresh_kickoffs(week)
+    print(f"[cli] sync-all: updated {updated} game rows, kickoff_at for {updates} game rows.")
+    return 0
+
 async def cmd_reset_season(args: argparse.Namespace) -> int:
     """
     Prepare for a new league year:
@@ -145,10 +202,9 @@ async def cmd_reset_season(args: argparse.Namespace) -> int:
       4. Sync the new season's schedule
       5. Re-seed tenant_weeks lock times from weeks.default_lock_at
     """
-    settings = get_settings()
-    cfg = settings.psycopg_kwargs()
+    from backend.utils.score_sync import ScoreSync  # pylint: disable=import-outside-toplevel
 
-    with get_connection(cfg) as conn, conn.cursor() as cur:
+    with get_connection() as conn, conn.cursor() as cur:
         year = getattr(args, "year", None) or None
         if not year:
             cur.execute("SELECT EXTRACT(YEAR FROM MIN(kickoff_at))::int FROM games")
@@ -178,7 +234,7 @@ async def cmd_reset_season(args: argparse.Namespace) -> int:
 
     # Step 1: Archive picks per tenant
     os.makedirs("archive", exist_ok=True)
-    with get_connection(cfg) as conn:
+    with get_connection() as conn:
         for tenant_id, tenant_name in tenants:
             archive_path = os.path.join("archive", f"{tenant_id}_{year}_picks.csv")
             with conn.cursor() as cur:
@@ -223,13 +279,13 @@ async def cmd_reset_season(args: argparse.Namespace) -> int:
 
     # Step 4: Sync new schedule (weeks + games)
     print("[cli] Syncing new season schedule...")
-    async with AsyncSessionLocal() as session:
+    async with _async_session() as session:
         sync = ScoreSync(session)
         changed = await sync.load_schedule()
         print(f"[cli] sync-schedule: upserted {changed} game rows")
 
     # Step 5: Re-seed tenant_weeks lock times for all tenants
-    with get_connection(cfg) as conn:
+    with get_connection() as conn:
         with conn.cursor() as cur:
             for tenant_id, tenant_name in tenants:
                 cur.execute("""
@@ -249,6 +305,8 @@ async def cmd_reset_season(args: argparse.Namespace) -> int:
 
 def cmd_import_picks_xlsx(args: argparse.Namespace) -> int:
     """Import historical picks from a pivoted XLSX workbook ('picks wk N' sheets)."""
+    from .utils.import_picks_xlsx import import_picks_pivot_xlsx  # pylint: disable=import-outside-toplevel
+
     # Friendly validation: require an existing file path
     if not getattr(args, "path", None):
         print("error: missing path to .xlsx workbook. See 'import-picks-xlsx -h' for usage.")
@@ -257,8 +315,7 @@ def cmd_import_picks_xlsx(args: argparse.Namespace) -> int:
         print(f"error: file not found: {args.path}")
         return 2
 
-    settings = get_settings()
-    cfg = settings.psycopg_kwargs()
+    cfg = _cfg()
     print(f"[cli] import-pivot-xlsx -> {cfg['user']}@{cfg['host']}:{cfg['port']}/{cfg['dbname']}")
 
     # Validate week constraints if provided
@@ -268,31 +325,28 @@ def cmd_import_picks_xlsx(args: argparse.Namespace) -> int:
         only_week = _validated_week(args.week)
     if getattr(args, "max_week", None) is not None:
         max_week = _validated_week(args.max_week)
+    if getattr(args, "batch_size", None) is not None and args.batch_size < 1:
+        print(f"error: --batch-size must be at least 1, got {args.batch_size}")
+        return 2
 
-    # One connection for the whole import
-    with get_connection(cfg) as conn:
-        # Turn on the bypass for this session (works across multiple transactions)
-        with conn.cursor() as cur:  # pylint: disable=no-member
-            cur.execute("SET app.bypass_lock = 'on';")
-
-        try:
-            # Do the import work (any inserts/updates on this conn will bypass the trigger)
-            extra_kwargs: dict[str, Any] = {}
-            if max_week is not None:
-                extra_kwargs["max_week"] = max_week
-            if only_week is not None:
-                extra_kwargs["only_week"] = only_week
-
-            processed = import_picks_pivot_xlsx(
-                xlsx_path=args.path,
-                conn=conn,
-                **extra_kwargs,
-            )
-            print(f"[cli] Pivot import complete. Processed {processed} player-pick cells.")
-        finally:
-            # Always clear the flag so future uses of this connection (or pooled conns) are safe
-            with conn.cursor() as cur:  # pylint: disable=no-member
-                cur.execute("RESET app.bypass_lock;")
+    extra_kwargs: dict[str, Any] = {}
+    if max_week is not None:
+        extra_kwargs["max_week"] = max_week
+    if only_week is not None:
+        extra_kwargs["only_week"] = only_week
+    if getattr(args, "batch_size", None) is not None:
+        extra_kwargs["batch_size"] = args.batch_size
+
+    # One connection and one transaction for the whole import. SET LOCAL scopes the
+    # trigger bypass to this transaction, so it clears itself at COMMIT/ROLLBACK.
+    with get_connection() as conn, conn.transaction():
+        conn.execute("SET LOCAL app.bypass_lock = 'on';")
+        processed = import_picks_pivot_xlsx(
+            xlsx_path=args.path,
+            conn=conn,
+            **extra_kwargs,
+        )
+    print(f"[cli] Pivot import complete. Processed {processed} player-pick cells.")
 
     return 0
 
@@ -304,17 +358,19 @@ async def cmd_run_job(args: argparse.Namespace) -> int:
       python -m backend.cli run-job email_mon --dry-run
       python -m backend.cli run-job email_tue_warn --mark
     """
+    from sqlalchemy import text  # pylint: disable=import-outside-toplevel
     job = args.job
-    if job not in _JOBS:
-        print(f"error: unknown job '{job}'. Choices: {', '.join(sorted(_JOBS.keys()))}")
+    run = _job_runner(job)
+    if run is None:
+        print(f"error: unknown job '{job}'. Choices: {', '.join(sorted(_JOB_NAMES))}")
         return 2
 
     # Optional email dry-run so you can exercise the whole path without sending
     if getattr(args, "dry_run", False):
         os.environ["EMAIL_DRY_RUN"] = "true"
 
-    async with AsyncSessionLocal() as session:
-        result = await _JOBS[job](session)
+    async with _async_session() as session:
+        result = await run(session)
         print(f"[cli] run-job {job}: {result}")
 
         if getattr(args, "mark", False):
@@ -334,9 +390,7 @@ async def cmd_run_job(args: argparse.Namespace) -> int:
 
 def cmd_list_leagues(_: argparse.Namespace) -> int:
     """List all tenants with member and player counts."""
-    settings = get_settings()
-    cfg = settings.psycopg_kwargs()
-    with get_connection(cfg) as conn, conn.cursor() as cur:
+    with get_connection() as conn, conn.cursor() as cur:
         cur.execute("""
                 SELECT t.tenant_id, t.name,
                        COUNT(DISTINCT tm.user_id) AS members,
@@ -360,9 +414,7 @@ def cmd_list_leagues(_: argparse.Namespace) -> int:
 
 def cmd_validate_rosters(args: argparse.Namespace) -> int:
     """Run read-only roster integrity checks for one or all tenants."""
-    settings = get_settings()
-    cfg = settings.psycopg_kwargs()
-    with get_connection(cfg) as conn:
+    with get_connection() as conn:
         report = validate_rosters(conn, tenant_id=args.tenant_id)
 
     if args.as_json:
@@ -379,15 +431,13 @@ def cmd_create_league(args: argparse.Namespace) -> int:
     'Commissioner' (pigeon_number=1) is created; rename it via League Settings after login.
     Default lock times (weeks.default_lock_at) are copied into tenant_weeks if available.
     """
-    settings = get_settings()
-    cfg = settings.psycopg_kwargs()
     name = args.name.strip()
     email = args.commissioner_email.strip().lower()
     if not name:
         print("error: --name cannot be empty")
         return 2
 
-    with get_connection(cfg) as conn:
+    with get_connection() as conn:
         with conn.cursor() as cur:
             cur.execute("SELECT user_id FROM users WHERE lower(email) = %s", (email,))
             row = cur.fetchone()
@@ -453,9 +503,7 @@ def cmd_run_sql(args: argparse.Namespace) -> int:
         print(f"error: file not found: {path}")
         return 1
 
-    settings = get_settings()
-    cfg = settings.psycopg_kwargs()
-    with get_connection(cfg) as conn:
+    with get_connection() as conn:
         with conn.cursor() as cur:
             cur.execute(sql)  # type: ignore[arg-type]
         conn.commit()
@@ -469,11 +517,9 @@ def cmd_delete_league(args: argparse.Namespace) -> int:
     Users who belong only to this league are also deleted.
     Requires --yes or interactive confirmation.
     """
-    settings = get_settings()
-    cfg = settings.psycopg_kwargs()
     tenant_id = args.tenant_id
 
-    with get_connection(cfg) as conn:
+    with get_connection() as conn:
         with conn.cursor() as cur:
             cur.execute("SELECT name FROM tenants WHERE tenant_id = %s", (tenant_id,))
             row = cur.fetchone()
@@ -562,10 +608,13 @@ def cmd_setup_fe_tests(_: argparse.Namespace) -> int:
       test            — tenant/player/user/token for stateful E2E tests
       snapshot        — commissioner token for the real tenant (snapshot tests only)
     """
-    settings = get_settings()
-    cfg = settings.psycopg_kwargs()
+    # Deferred: routes.auth pulls in FastAPI and the emailer, which no other command needs.
+    # pylint: disable=import-outside-toplevel
+    from passlib.hash import bcrypt as _bcrypt  # pyright: ignore[reportAttributeAccessIssue]
+
+    from backend.routes.auth import make_session_token
 
-    with get_connection(cfg) as conn:
+    with get_connection() as conn:
         with conn.cursor() as cur:
             # Guard against leftover data from an aborted previous run.
             cur.execute("DELETE FROM tenants WHERE name = '_Test FE League'")
@@ -770,12 +819,10 @@ def cmd_teardown_fe_tests(_: argparse.Namespace) -> int:
     with open(state_path, encoding="utf-8") as f:
         state = json.load(f)
 
-    settings = get_settings()
-    cfg = settings.psycopg_kwargs()
     synthetic = state.get("test", {}).get("synthetic_game_ids", [])
     overwritten = state.get("test", {}).get("overwritten_games", [])
 
-    with get_connection(cfg) as conn:
+    with get_connection() as conn:
         with conn.cursor() as cur:
             if synthetic:
                 cur.execute("DELETE FROM games WHERE game_id = ANY(%s)", (synthetic,))
@@ -799,12 +846,15 @@ async def cmd_show_email_recipients(args: argparse.Namespace) -> int:
     Show who would receive emails for a given email job, broken down per tenant.
     Sun/Mon: all tenant members. Tue: only members with missing picks for the next week.
     """
+    from sqlalchemy import text  # pylint: disable=import-outside-toplevel
+
+    from backend.utils.scheduled_jobs import get_all_player_emails  # pylint: disable=import-outside-toplevel
     which = args.which
     if which not in ("sun", "mon", "tue"):
         print("error: --which must be one of: sun | mon | tue")
         return 2
 
-    async with AsyncSessionLocal() as session:
+    async with _async_session() as session:
         tenants_res = await session.execute(
             text("SELECT tenant_id, name FROM tenants ORDER BY tenant_id")
         )
@@ -840,6 +890,7 @@ async def cmd_show_email_recipients(args: argparse.Namespace) -> int:
                        AND g.week_number = (SELECT w FROM next_week)
                 """), {"tid": tenant_id})
                 player_ids = [r[0] for r in rows.fetchall()]
+                # Same helper as run_email_tue_warn, so the preview matches what the job sends
                 emails = await get_all_player_emails(session, player_ids)
 
             for e in emails:
@@ -853,16 +904,21 @@ async def cmd_show_email_recipients(args: argparse.Namespace) -> int:
 # -----------------------------------------------------------------------------
 # Parser / Main
 # -----------------------------------------------------------------------------
+_VALID_WEEKS = frozenset(range(1, 19))
+
+
 def _validated_week(week: int) -> int:
     """Ensure week is within 1..18."""
-    if not 1 <= week <= 18:
+    if week not in _VALID_WEEKS:
         raise SystemExit(f"error: week must be between 1 and 18, got {week}")
     return week
 
 
+@lru_cache(maxsize=1)
 def build_parser() -> argparse.ArgumentParser:
     """
     Construct the top-level argument parser and subcommands.
+    Built once per process; parse_args() doesn't mutate the parser, so reuse is safe.
     """
     parser = _HelpOnErrorParser(
         prog="pigeon-backend-cli",
@@ -884,7 +940,9 @@ def build_parser() -> argparse.ArgumentParser:
         help="Update scores & status for the given week.",
         description="Calls ScoreSync.sync_scores_and_status(week) to update scores/status.",
     )
-    p_sync.add_argument("week", type=int, help="Week number (1–18)")
+    p_sync.add_argument("week", type=int, choices=_VALID_WEEKS, metavar="WEEK", help="Week number (1–18)")
+    p_sync.add_argument("--force", action="store_true",
+                        help="Sync even when no game is live or kicking off within 15 minutes (e.g. stat corrections)")
     p_sync.set_defaults(func=cmd_sync_scores)
 
     # sync-kickoffs
@@ -893,9 +951,18 @@ def build_parser() -> argparse.ArgumentParser:
         help="Refresh kickoff times for the given week.",
         description="Calls ScoreSync.refresh_kickoffs(week) to update kickoff_at fields.",
     )
-    p_kickoffs.add_argument("week", type=int, help="Week number (1–18)")
+    p_kickoffs.add_argument("week", type=int, choices=_VALID_WEEKS, metavar="WEEK", help="Week number (1–18)")
     p_kickoffs.set_defaults(func=cmd_sync_kickoffs)
 
+    # sync-all
+    p_sync_all = sub.add_parser(
+        "sync-all",
+        help="Sync scores & status, then refresh kickoff times, for the given week.",
+        description="Runs ScoreSync.sync_scores_and_status(week) then ScoreSync.refresh_kickoffs(week) on one session.",
+    )
+    p_sync_all.add_argument("week", type=int, choices=_VALID_WEEKS, metavar="WEEK", help="Week number (1–18)")
+    p_sync_all.set_defaults(func=cmd_sync_all)
+
     # reset-season
     p_reset = sub.add_parser(
         "reset-season",
@@ -919,8 +986,16 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_imp_pivot.add_argument("path", help="Path to .xlsx workbook")
     group = p_imp_pivot.add_mutually_exclusive_group()
-    group.add_argument("--week", type=int, help="Import only a single week (1–18)")
-    group.add_argument("--max-week", type=int, help="Highest week to import")
+    group.add_argument("--week", type=int, choices=_VALID_WEEKS, metavar="WEEK", help="Import only a single week (1–18)")
+    group.add_argument("--max-week", type=int, choices=_VALID_WEEKS, metavar="WEEK", help="Highest week to import")
+    p_imp_pivot.add_argument(
+        "--batch-size", type=int, default=None, metavar="N",
+        help=(
+            "Picks buffered per COPY + merge flush (default 1000). COPY has no bind-parameter "
+            "limit, so this only trades client memory for fewer statements; 500–2000 is plenty "
+            "for a 68-pigeon sheet (~1,100 picks)."
+        ),
+    )
     p_imp_pivot.set_defaults(func=cmd_import_picks_xlsx)
 
     # run-job
@@ -931,7 +1006,7 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_run_job.add_argument(
         "job",
-        choices=["kickoff_sync","score_sync","email_sun","email_mon","email_tue_warn"],
+        choices=_JOB_NAMES,
         help="Job name to run now",
     )
     p_run_job.add_argument("--mark", action="store_true", help="Update scheduler_runs.last_at after success")
@@ -1025,6 +1100,15 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """uvloop's event loop when installed (uvicorn[standard] pulls it in off Windows)."""
+    try:
+        import uvloop  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 def main(argv: list[str] | None = None) -> int:
     """
     CLI entry point.
@@ -1036,7 +1120,7 @@ def main(argv: list[str] | None = None) -> int:
         return 2
     func = args.func
     if asyncio.iscoroutinefunction(func):
-        return asyncio.run(func(args))
+        return asyncio.run(func(args), loop_factory=_loop_factory())
     else:
         return func(args)
 
@@ -7,6 +7,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from backend.routes.admin import router as admin_router
+from backend.routes.auth import ensure_reset_table
 from backend.routes.auth import router as auth_router
 from backend.routes.me import router as me_router
 from backend.routes.picks import router as picks_router
@@ -28,6 +29,11 @@ logger.info(f"Database: {s.pg_host}:{s.pg_port}/{s.pg_db}")
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     """Application startup and shutdown lifecycle."""
+    try:
+        await ensure_reset_table()
+    except Exception as ex:  # noqa: BLE001 - a DB outage must not stop the API from booting
+        logger.warn("startup: could not ensure password_reset_uses; will retry on first reset",
+                    err_type=type(ex).__name__, err=str(ex))
     if DISABLE_SCHEDULER:
         yield
         return
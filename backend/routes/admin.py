@@ -7,9 +7,9 @@ within the active tenant. All data-access routes are scoped to me.tenant_id.
 
 from __future__ import annotations
 
+import asyncio
 import os
 import secrets
-import string
 import tempfile
 from datetime import UTC, datetime, timedelta
 from typing import Literal
@@ -25,7 +25,15 @@ from fastapi import (
     UploadFile,
     status,
 )
-from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
+from passlib.hash import bcrypt  # pyright: ignore[reportAttributeAccessIssue]
+from pydantic import (
+    BaseModel,
+    EmailStr,
+    Field,
+    TypeAdapter,
+    field_validator,
+    model_validator,
+)
 from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -38,7 +46,7 @@ from backend.utils.validation import validate_pigeon_name
 
 from .auth import require_admin, require_user
 from .results import WeekPicksRow
-from .schedule import get_current_week
+from .schedule import get_current_week, invalidate_current_week
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -56,16 +64,20 @@ WEEK_PICKS_SQL = text("""
       predicted_margin,
       home_abbr,
       away_abbr,
-      kickoff_at,
+      -- ISO text built in SQL (same shape as datetime.isoformat() for UTC)
+      to_char(v.kickoff_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS"+00:00"') AS kickoff_at,
       status,
       home_score,
       away_score
-    FROM v_week_picks_with_names
+    FROM v_week_picks_with_names v
     WHERE week_number = :week
       AND tenant_id   = :tenant_id
-    ORDER BY pigeon_number, kickoff_at, game_id
+    ORDER BY pigeon_number, v.kickoff_at, game_id
 """)
 
+# Built once; validates a whole result set in one call instead of a model per row
+_WEEK_PICKS_ADAPTER = TypeAdapter(list[WeekPicksRow])
+
 @router.get(
     "/weeks/{week}/picks",
     response_model=list[WeekPicksRow],
@@ -82,26 +94,13 @@ async def get_week_picks(
         warn("admin: non-commissioner attempted to access picks", user=me.pigeon_number, week=week)
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Commissioner access required")
 
-    rows = (await db.execute(WEEK_PICKS_SQL, {"week": week, "tenant_id": me.tenant_id})).fetchall()
+    rows = (await db.execute(WEEK_PICKS_SQL, {"week": week, "tenant_id": me.tenant_id})).mappings().all()
     info("admin: week picks rows", week=week, count=len(rows))
 
-    return [
-        WeekPicksRow(
-            pigeon_number=r[0],
-            pigeon_name=r[1],
-            game_id=r[2],
-            week_number=r[3],
-            picked_home=r[4],
-            predicted_margin=r[5],
-            home_abbr=r[6],
-            away_abbr=r[7],
-            kickoff_at=r[8].isoformat(),
-            status=r[9],
-            home_score=r[10],
-            away_score=r[11],
-        )
-        for r in rows
-    ]
+    # Serialize in pydantic-core and return the bytes directly; FastAPI skips its
+    # response_model re-validation + jsonable_encoder pass for a Response
+    picks = _WEEK_PICKS_ADAPTER.validate_python(rows)
+    return Response(content=_WEEK_PICKS_ADAPTER.dump_json(picks), media_type="application/json")
 
 
 # ---------------------------------------------------------------------------
@@ -154,9 +153,12 @@ async def update_league(
 # Lock-time management (tenant_weeks, not weeks.lock_at)
 # ---------------------------------------------------------------------------
 
-WEEK_EXISTS_SQL = text("SELECT 1 FROM weeks WHERE week_number = :week")
-
-FIRST_KICKOFF_SQL = text("SELECT MIN(kickoff_at) FROM games WHERE week_number = :week")
+# No row: the week doesn't exist. NULL first_kickoff: it has no games yet.
+WEEK_FIRST_KICKOFF_SQL = text("""
+    SELECT (SELECT MIN(kickoff_at) FROM games g WHERE g.week_number = w.week_number) AS first_kickoff
+    FROM weeks w
+    WHERE w.week_number = :week
+""")
 
 TENANT_WEEK_LOCK_SQL = text("""
     SELECT lock_at FROM tenant_weeks
@@ -183,6 +185,9 @@ class WeekLockRow(BaseModel):
     lock_at: datetime
 
 
+_WEEK_LOCKS_ADAPTER = TypeAdapter(list[WeekLockRow])
+
+
 @router.get(
     "/weeks/locks",
     response_model=list[WeekLockRow],
@@ -193,9 +198,9 @@ async def get_weeks_locks(
     me=Depends(require_admin),
 ):
     debug("admin: get_weeks_locks called", user=me.pigeon_number)
-    rows = (await db.execute(TENANT_WEEKS_LOCKS_SQL, {"tenant_id": me.tenant_id})).fetchall()
+    rows = (await db.execute(TENANT_WEEKS_LOCKS_SQL, {"tenant_id": me.tenant_id})).mappings().all()
     info("admin: weeks lock rows", count=len(rows))
-    return [WeekLockRow(week_number=r[0], lock_at=r[1]) for r in rows]
+    return _WEEK_LOCKS_ADAPTER.validate_python(rows)
 
 
 @router.patch(
@@ -218,8 +223,9 @@ async def adjust_week_lock(
     """
     debug("admin: adjust_week_lock called", user=me.pigeon_number, week=week)
 
-    exists = (await db.execute(WEEK_EXISTS_SQL, {"week": week})).first()
-    if not exists:
+    # Existence and first kickoff in one round-trip; checked in the original order below
+    week_row = (await db.execute(WEEK_FIRST_KICKOFF_SQL, {"week": week})).first()
+    if not week_row:
         raise HTTPException(status_code=404, detail=f"Week {week} not found")
 
     current = await get_current_week(db, me)
@@ -237,8 +243,7 @@ async def adjust_week_lock(
     else:
         new_lock = new_lock.astimezone(UTC)
 
-    first_row = (await db.execute(FIRST_KICKOFF_SQL, {"week": week})).first()
-    first_kickoff = first_row[0] if first_row else None
+    first_kickoff = week_row[0]
     if first_kickoff is None:
         raise HTTPException(status_code=400, detail=f"No games scheduled for week {week}")
 
@@ -253,6 +258,7 @@ async def adjust_week_lock(
 
     await db.execute(UPSERT_TENANT_WEEK_LOCK_SQL, {"tenant_id": me.tenant_id, "week": week, "lock_at": new_lock})
     await db.commit()
+    invalidate_current_week(me.tenant_id)
     info("admin: week lock updated", week=week, lock_at=new_lock.isoformat(), tenant_id=me.tenant_id)
     return Response(status_code=204)
 
@@ -261,14 +267,19 @@ async def adjust_week_lock(
 # Season activation: copy default lock times into this tenant's tenant_weeks
 # ---------------------------------------------------------------------------
 
-DEFAULT_LOCK_AT_SQL = text("""
-    SELECT week_number, default_lock_at FROM weeks ORDER BY week_number
-""")
-
+# One round-trip: copy every week with a default lock time, and report how many
+# weeks were eligible (0 means the global schedule hasn't been imported yet).
 ACTIVATE_SEASON_SQL = text("""
-    INSERT INTO tenant_weeks (tenant_id, week_number, lock_at)
-    VALUES (:tenant_id, :week_number, :lock_at)
-    ON CONFLICT (tenant_id, week_number) DO NOTHING
+    WITH ready AS (
+      SELECT week_number, default_lock_at
+      FROM weeks
+      WHERE default_lock_at IS NOT NULL
+    ), ins AS (
+      INSERT INTO tenant_weeks (tenant_id, week_number, lock_at)
+      SELECT :tenant_id, week_number, default_lock_at FROM ready
+      ON CONFLICT (tenant_id, week_number) DO NOTHING
+    )
+    SELECT COUNT(*) FROM ready
 """)
 
 
@@ -287,21 +298,15 @@ async def activate_season(
     Errors if no default lock times exist (global schedule not yet imported for the season).
     """
     debug("admin: activate_season called", tenant_id=me.tenant_id)
-    rows = (await db.execute(DEFAULT_LOCK_AT_SQL)).fetchall()
-    ready = [(r[0], r[1]) for r in rows if r[1] is not None]
+    ready = (await db.execute(ACTIVATE_SEASON_SQL, {"tenant_id": me.tenant_id})).scalar_one()
     if not ready:
         raise HTTPException(
             status_code=400,
             detail="No default lock times found. Import the season schedule first.",
         )
-    for week_number, lock_at in ready:
-        await db.execute(ACTIVATE_SEASON_SQL, {
-            "tenant_id": me.tenant_id,
-            "week_number": week_number,
-            "lock_at": lock_at,
-        })
     await db.commit()
-    info("admin: season activated", tenant_id=me.tenant_id, weeks=len(ready))
+    invalidate_current_week(me.tenant_id)
+    info("admin: season activated", tenant_id=me.tenant_id, weeks=ready)
     return Response(status_code=204)
 
 
@@ -550,9 +555,13 @@ class PigeonUpdate(PigeonAggregateIn):
     season_status: Literal["pending", "active", "out"]
 
 
-def _random_password_hash(length: int = 16) -> str:
-    alphabet = string.ascii_letters + string.digits + string.punctuation
-    return "".join(secrets.choice(alphabet) for _ in range(length))
+async def _random_password_hash() -> str:
+    """
+    Bcrypt hash of a random password nobody is told; new users set their own via reset.
+    Storing the raw string would make it a plaintext credential (login falls back to
+    equality for non-bcrypt hashes). bcrypt is CPU-bound, so it runs off the event loop.
+    """
+    return await asyncio.to_thread(bcrypt.hash, secrets.token_urlsafe(16))
 
 
 def _normalize_email(email: EmailStr | str) -> str:
@@ -602,7 +611,7 @@ async def _find_or_create_user(db: AsyncSession, email: EmailStr | str) -> tuple
 
     created = (await db.execute(INSERT_USER_SQL, {
         "email": normalized,
-        "password_hash": _random_password_hash(),
+        "password_hash": await _random_password_hash(),
     })).first()
     if created:
         return created[0], created[1]
@@ -703,20 +712,21 @@ async def _replace_player_assignments(
                 "player_id": player_id,
             })
 
-    for user_id, role in existing_roles.items():
-        if role == "manager" and user_id not in desired_roles:
-            await db.execute(DELETE_PLAYER_ASSIGNMENT_SQL, {
-                "user_id": user_id,
-                "player_id": player_id,
-            })
+    removed = [
+        {"user_id": user_id, "player_id": player_id}
+        for user_id, role in existing_roles.items()
+        if role == "manager" and user_id not in desired_roles
+    ]
+    if removed:
+        await db.execute(DELETE_PLAYER_ASSIGNMENT_SQL, removed)
 
-    for user_id, role in desired_roles.items():
-        if existing_roles.get(user_id) != role:
-            await db.execute(UPSERT_PLAYER_ASSIGNMENT_SQL, {
-                "user_id": user_id,
-                "player_id": player_id,
-                "role": role,
-            })
+    changed = [
+        {"user_id": user_id, "player_id": player_id, "role": role}
+        for user_id, role in desired_roles.items()
+        if existing_roles.get(user_id) != role
+    ]
+    if changed:
+        await db.execute(UPSERT_PLAYER_ASSIGNMENT_SQL, changed)
 
     return affected_user_ids
 
@@ -773,12 +783,12 @@ async def create_pigeon(
                 manager_id, _ = await _find_or_create_user(db, manager_email)
                 desired_roles[manager_id] = "manager"
 
-            for user_id, role in desired_roles.items():
-                await db.execute(UPSERT_PLAYER_ASSIGNMENT_SQL, {
-                    "user_id": user_id,
-                    "player_id": player_id,
-                    "role": role,
-                })
+            # One executemany for every assignment; membership repair reads them back per user
+            await db.execute(UPSERT_PLAYER_ASSIGNMENT_SQL, [
+                {"user_id": user_id, "player_id": player_id, "role": role}
+                for user_id, role in desired_roles.items()
+            ])
+            for user_id in desired_roles:
                 await _repair_tenant_membership(
                     db,
                     me.tenant_id,
@@ -1011,7 +1021,8 @@ async def send_bulk_email(
     debug("admin: send_bulk_email called", tenant_id=me.tenant_id, subject=req.subject)
     rows = (await db.execute(GET_TENANT_EMAILS_SQL, {"tenant_id": me.tenant_id})).fetchall()
     emails = [r[0] for r in rows if r[0]]
-    ok = send_bulk_email_to_all_users(emails, req.subject, req.text)
+    # The Azure SDK blocks while it polls the send to completion; keep the event loop free
+    ok = await asyncio.to_thread(send_bulk_email_to_all_users, emails, req.subject, req.text)
     if not ok:
         raise HTTPException(status_code=500, detail="Failed to send bulk email.")
     return Response(status_code=204)
@@ -1042,14 +1053,14 @@ async def import_picks_xlsx_api(
             detail="XLSX import is only available for the original league.",
         )
 
-    contents = await file.read()
+    # Copy the upload in 1 MiB chunks rather than holding the whole workbook in memory
     with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
-        tmp.write(contents)
+        while chunk := await file.read(1 << 20):
+            tmp.write(chunk)
         tmp_path = tmp.name
 
-    import asyncio as _asyncio
     try:
-        processed = await _asyncio.to_thread(
+        processed = await asyncio.to_thread(
             import_picks_pivot_xlsx_with_engine,
             tmp_path,
             week,
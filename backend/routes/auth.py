@@ -11,25 +11,27 @@ JWT token shape (Stage 5+):
 
 # pylint: disable=line-too-long
 
-import binascii
-import os
+import asyncio
 import re
+import secrets
 from datetime import UTC, datetime, timedelta
 
 import jwt
-import psycopg
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from passlib.hash import bcrypt  # pyright: ignore[reportAttributeAccessIssue]
 from pydantic import BaseModel, EmailStr
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.utils.db import AsyncSessionLocal, get_db
 from backend.utils.emailer import send_email
 from backend.utils.logger import debug, error, info, warn
 from backend.utils.settings import get_settings
 
 # --- Config ---
 S = get_settings()
-DB_CFG = S.psycopg_kwargs()
 JWT_SECRET = S.jwt_secret
 JWT_ALG = S.jwt_alg
 FRONTEND_ORIGIN = S.frontend_origins[0]
@@ -43,10 +45,6 @@ bearer = HTTPBearer(
     bearerFormat="JWT",
 )
 
-# --- DB helper ---
-def db():
-    return psycopg.connect(**DB_CFG)
-
 # --- Models ---
 class LoginIn(BaseModel):
     email: EmailStr
@@ -120,15 +118,15 @@ def parse_session_token(token: str) -> dict:
     return data
 
 # --- Queries ---
-def find_user(cur, email: str) -> tuple | None:
+async def find_user(db: AsyncSession, email: str) -> tuple | None:
     """Returns (user_id, email, password_hash) or None."""
-    cur.execute(
-        "SELECT user_id, email, password_hash FROM users WHERE lower(email) = lower(%s)",
-        (email.strip(),)
+    res = await db.execute(
+        text("SELECT user_id, email, password_hash FROM users WHERE lower(email) = lower(:email)"),
+        {"email": email.strip()},
     )
-    return cur.fetchone()
+    return res.first()
 
-def select_tenant_context(cur, user_id: int, tenant_id: int | None = None) -> tuple | None:
+async def select_tenant_context(db: AsyncSession, user_id: int, tenant_id: int | None = None) -> tuple | None:
     """
     Pick the tenant context for a user.
     If tenant_id is given, validate membership in that specific tenant.
@@ -136,53 +134,53 @@ def select_tenant_context(cur, user_id: int, tenant_id: int | None = None) -> tu
     Returns (player_id, pigeon_number, pigeon_name, tenant_id, is_commissioner, tenant_name) or None.
     """
     if tenant_id is not None:
-        cur.execute("""
+        res = await db.execute(text("""
             SELECT p.player_id, p.pigeon_number, p.pigeon_name,
                    tm.tenant_id, (tm.role = 'commissioner') AS is_admin,
                    t.name
               FROM tenant_members tm
               JOIN players p ON p.player_id = tm.primary_player_id
               JOIN tenants t ON t.tenant_id = tm.tenant_id
-             WHERE tm.user_id = %s AND tm.tenant_id = %s
-        """, (user_id, tenant_id))
+             WHERE tm.user_id = :user_id AND tm.tenant_id = :tenant_id
+        """), {"user_id": user_id, "tenant_id": tenant_id})
     else:
-        cur.execute("""
+        res = await db.execute(text("""
             SELECT p.player_id, p.pigeon_number, p.pigeon_name,
                    tm.tenant_id, (tm.role = 'commissioner') AS is_admin,
                    t.name
               FROM tenant_members tm
               JOIN players p ON p.player_id = tm.primary_player_id
               JOIN tenants t ON t.tenant_id = tm.tenant_id
-             WHERE tm.user_id = %s
+             WHERE tm.user_id = :user_id
              ORDER BY tm.last_used_at DESC NULLS LAST
              LIMIT 1
-        """, (user_id,))
-    return cur.fetchone()
+        """), {"user_id": user_id})
+    return res.first()
 
-def set_last_used_at(cur, user_id: int, tenant_id: int) -> None:
-    cur.execute(
-        "UPDATE tenant_members SET last_used_at = now() WHERE user_id = %s AND tenant_id = %s",
-        (user_id, tenant_id)
+async def set_last_used_at(db: AsyncSession, user_id: int, tenant_id: int) -> None:
+    await db.execute(
+        text("UPDATE tenant_members SET last_used_at = now() WHERE user_id = :user_id AND tenant_id = :tenant_id"),
+        {"user_id": user_id, "tenant_id": tenant_id},
     )
 
-def get_available_tenants(cur, user_id: int) -> list[TenantInfo]:
-    cur.execute("""
+async def get_available_tenants(db: AsyncSession, user_id: int) -> list[TenantInfo]:
+    res = await db.execute(text("""
         SELECT t.tenant_id, t.name, tm.role, t.pigeons_can_rename
           FROM tenant_members tm
           JOIN tenants t ON t.tenant_id = tm.tenant_id
-         WHERE tm.user_id = %s
+         WHERE tm.user_id = :user_id
          ORDER BY tm.last_used_at DESC NULLS LAST, t.name
-    """, (user_id,))
+    """), {"user_id": user_id})
     return [
         TenantInfo(tenant_id=r[0], name=r[1], role=r[2], pigeons_can_rename=r[3])
-        for r in cur.fetchall()
+        for r in res.all()
     ]
 
 # --- Password reset helpers ---
 def make_reset_token(user_id: int) -> str:
     now = datetime.now(UTC)
     exp = now + timedelta(minutes=RESET_TTL_MINUTES)
-    jti = binascii.hexlify(os.urandom(16)).decode()
+    jti = secrets.token_hex(16)
     payload = {
         "sub": str(user_id),
         "typ": "reset",
@@ -203,26 +201,45 @@ def parse_reset_token(token: str) -> dict:
         raise HTTPException(status_code=401, detail="Malformed reset token")
     return data
 
-def ensure_reset_table(conn: psycopg.Connection) -> None:
-    with conn.cursor() as cur:
-        cur.execute("""
+_reset_table_ready = False
+
+
+async def ensure_reset_table() -> None:
+    """
+    Create the single-use reset token table if missing. Called once at app startup;
+    if the DB was unreachable then, the first reset confirmation retries it.
+    """
+    global _reset_table_ready  # pylint: disable=global-statement
+    if _reset_table_ready:
+        return
+    async with AsyncSessionLocal() as db:
+        await db.execute(text("""
             CREATE TABLE IF NOT EXISTS password_reset_uses (
               jti TEXT PRIMARY KEY,
               user_id BIGINT NOT NULL REFERENCES users(user_id) ON DELETE CASCADE,
               used_at TIMESTAMPTZ NOT NULL DEFAULT now()
             );
-        """)
-        conn.commit()
-
-def jti_already_used(cur: psycopg.Cursor, jti: str) -> bool:
-    cur.execute("SELECT 1 FROM password_reset_uses WHERE jti = %s", (jti,))
-    return cur.fetchone() is not None
-
-def mark_jti_used(cur: psycopg.Cursor, jti: str, user_id: int) -> None:
-    cur.execute(
-        "INSERT INTO password_reset_uses (jti, user_id) VALUES (%s, %s) ON CONFLICT DO NOTHING",
-        (jti, user_id),
+        """))
+        await db.commit()
+    _reset_table_ready = True
+
+# Claims the jti and sets the new hash in one statement. Returns (email, updated_email):
+# email is NULL for an unknown user; updated_email is NULL when the jti was already used.
+CONSUME_RESET_SQL = text("""
+    WITH u AS (
+      SELECT user_id, email FROM users WHERE user_id = :uid
+    ), used AS (
+      INSERT INTO password_reset_uses (jti, user_id)
+      SELECT :jti, user_id FROM u
+      ON CONFLICT DO NOTHING
+      RETURNING user_id
+    ), upd AS (
+      UPDATE users SET password_hash = :new_hash
+       WHERE user_id IN (SELECT user_id FROM used)
+      RETURNING email
     )
+    SELECT (SELECT email FROM u), (SELECT email FROM upd)
+""")
 
 def sent_password_reset_email(to_email: str, token: str) -> None:
     origins = S.frontend_origins
@@ -252,7 +269,22 @@ def sent_password_reset_email(to_email: str, token: str) -> None:
     send_email(to_email, subject, plain_text, html)
 
 # --- Bearer auth dependency ---
-def current_user(creds: HTTPAuthorizationCredentials = Depends(bearer)) -> MeOut:
+CURRENT_USER_SQL = text("""
+    SELECT p.player_id, p.pigeon_number, p.pigeon_name, u.email,
+           (tm.role = 'commissioner') AS is_admin, tm.tenant_id
+      FROM user_players up
+      JOIN players p  ON p.player_id  = up.player_id
+      JOIN users u    ON u.user_id    = up.user_id
+      JOIN tenant_members tm
+        ON tm.user_id   = up.user_id
+       AND tm.tenant_id = p.tenant_id
+     WHERE up.user_id   = :uid
+       AND up.player_id = :player_id
+       AND p.tenant_id  = :tenant_id
+     LIMIT 1
+""")
+
+async def current_user(creds: HTTPAuthorizationCredentials = Depends(bearer)) -> MeOut:
     """
     Validate Authorization: Bearer <token> and return MeOut.
     Token must carry: sub (player_id), uid (user_id), tid (tenant_id).
@@ -273,34 +305,24 @@ def current_user(creds: HTTPAuthorizationCredentials = Depends(bearer)) -> MeOut
         warn("Malformed session token payload", exc=exc)
         raise HTTPException(status_code=401, detail="Malformed session token") from None
 
-    with db() as conn, conn.cursor() as cur:
-        cur.execute("""
-            SELECT p.player_id, p.pigeon_number, p.pigeon_name, u.email,
-                   (tm.role = 'commissioner') AS is_admin, tm.tenant_id
-              FROM user_players up
-              JOIN players p  ON p.player_id  = up.player_id
-              JOIN users u    ON u.user_id    = up.user_id
-              JOIN tenant_members tm
-                ON tm.user_id   = up.user_id
-               AND tm.tenant_id = p.tenant_id
-             WHERE up.user_id   = %s
-               AND up.player_id = %s
-               AND p.tenant_id  = %s
-             LIMIT 1
-        """, (uid, player_id, tenant_id))
-        row = cur.fetchone()
-        if not row:
-            raise HTTPException(status_code=401, detail="User/player/tenant mapping not found")
-
-        return MeOut(
-            player_id=row[0],
-            pigeon_number=row[1],
-            pigeon_name=row[2],
-            email=row[3],
-            is_admin=row[4],
-            tenant_id=row[5],
-            session={"expires_at": datetime.fromtimestamp(exp_ts, tz=UTC).isoformat()},
-        )
+    # Own short-lived session: the route's get_db session must not be autobegun here,
+    # since several admin routes open it with db.begin().
+    async with AsyncSessionLocal() as db:
+        res = await db.execute(CURRENT_USER_SQL, {"uid": uid, "player_id": player_id, "tenant_id": tenant_id})
+        row = res.first()
+    if not row:
+        raise HTTPException(status_code=401, detail="User/player/tenant mapping not found")
+
+    # Trusted DB row: skip validation (EmailStr runs email_validator in Python) on the auth hot path
+    return MeOut.model_construct(
+        player_id=row[0],
+        pigeon_number=row[1],
+        pigeon_name=row[2],
+        email=row[3],
+        is_admin=row[4],
+        tenant_id=row[5],
+        session={"expires_at": datetime.fromtimestamp(exp_ts, tz=UTC).isoformat()},
+    )
 
 # --- Router ---
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -312,7 +334,7 @@ def _build_login_response(uid: int, email: str, ctx) -> dict:
     """
     player_id, pn, name, tenant_id, is_admin, _tenant_name = ctx
     token, exp_ts = make_session_token(player_id, tenant_id, email, uid=uid)
-    me_out = MeOut(
+    me_out = MeOut.model_construct(
         player_id=player_id,
         pigeon_number=pn,
         pigeon_name=name,
@@ -330,41 +352,45 @@ def _build_login_response(uid: int, email: str, ctx) -> dict:
     }
 
 @router.post("/login", response_model=LoginOut)
-def login(payload: LoginIn):
+async def login(payload: LoginIn, db: AsyncSession = Depends(get_db)):
     """Login and return a Bearer token scoped to the user's most-recently-used tenant."""
     debug("In login")
 
-    with db() as conn, conn.cursor() as cur:
-        user_row = find_user(cur, payload.email)
-        if not user_row:
-            raise HTTPException(status_code=401, detail="Invalid credentials")
+    user_row = await find_user(db, payload.email)
+    if not user_row:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
 
-        uid, email, stored_hash = user_row
+    uid, email, stored_hash = user_row
 
+    ok = False
+    try:
+        if stored_hash and stored_hash.startswith("$2"):
+            # bcrypt is deliberately slow; keep it off the event loop
+            ok = await asyncio.to_thread(bcrypt.verify, payload.password, stored_hash)
+        else:
+            ok = payload.password == stored_hash
+    except (ValueError, TypeError):
         ok = False
-        try:
-            if stored_hash and stored_hash.startswith("$2"):
-                ok = bcrypt.verify(payload.password, stored_hash)
-            else:
-                ok = payload.password == stored_hash
-        except (ValueError, TypeError):
-            ok = False
-
-        if not ok:
-            raise HTTPException(status_code=401, detail="Invalid credentials")
-
-        ctx = select_tenant_context(cur, uid)
-        if not ctx:
-            raise HTTPException(status_code=403, detail="No tenant/player assigned to this user")
 
-        set_last_used_at(cur, uid, ctx[3])  # ctx[3] = tenant_id
-        conn.commit()
+    if not ok:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+
+    ctx = await select_tenant_context(db, uid)
+    if not ctx:
+        raise HTTPException(status_code=403, detail="No tenant/player assigned to this user")
+
+    await set_last_used_at(db, uid, ctx[3])  # ctx[3] = tenant_id
+    await db.commit()
 
     return _build_login_response(uid, email, ctx)
 
 
 @router.post("/select-context", response_model=LoginOut)
-def select_context(payload: SelectContextIn, creds: HTTPAuthorizationCredentials = Depends(bearer)):
+async def select_context(
+    payload: SelectContextIn,
+    creds: HTTPAuthorizationCredentials = Depends(bearer),
+    db: AsyncSession = Depends(get_db),
+):
     """
     Switch the active tenant. Validates that the caller is a member of the requested
     tenant, then issues a new session token scoped to that tenant.
@@ -382,42 +408,40 @@ def select_context(payload: SelectContextIn, creds: HTTPAuthorizationCredentials
     except (KeyError, ValueError, TypeError):
         raise HTTPException(status_code=401, detail="Malformed session token") from None
 
-    with db() as conn, conn.cursor() as cur:
-        ctx = select_tenant_context(cur, uid, tenant_id=payload.tenant_id)
-        if not ctx:
-            raise HTTPException(status_code=403, detail="Not a member of that tenant")
+    ctx = await select_tenant_context(db, uid, tenant_id=payload.tenant_id)
+    if not ctx:
+        raise HTTPException(status_code=403, detail="Not a member of that tenant")
 
-        set_last_used_at(cur, uid, payload.tenant_id)
-        conn.commit()
+    await set_last_used_at(db, uid, payload.tenant_id)
+    await db.commit()
 
     return _build_login_response(uid, email, ctx)
 
 
 @router.get("/me", response_model=MeOut)
-def me(user: MeOut = Depends(current_user)):
+async def me(user: MeOut = Depends(current_user), db: AsyncSession = Depends(get_db)):
     debug("In me")
 
-    with db() as conn, conn.cursor() as cur:
-        # Alt pigeons within the active tenant
-        cur.execute("""
-            SELECT p.player_id, p.pigeon_number, p.pigeon_name
-              FROM user_players up
-              JOIN players p ON p.player_id = up.player_id
-             WHERE up.user_id = (SELECT user_id FROM users WHERE lower(email) = lower(%s))
-               AND p.tenant_id = %s
-               AND up.player_id <> %s
-               AND up.role IN ('owner','manager')
-             ORDER BY p.pigeon_number
-        """, (user.email, user.tenant_id, user.player_id))
-        alt_rows = cur.fetchall()
-        alt_pigeons = [AltPigeon(player_id=r[0], pigeon_number=r[1], pigeon_name=r[2]) for r in alt_rows]
-
-        # All tenants this user belongs to
-        uid_row = cur.execute(
-            "SELECT user_id FROM users WHERE lower(email) = lower(%s)", (user.email,)
-        ).fetchone()
-        uid = uid_row[0] if uid_row else None
-        available_tenants = get_available_tenants(cur, uid) if uid else []
+    # Alt pigeons within the active tenant
+    res = await db.execute(text("""
+        SELECT p.player_id, p.pigeon_number, p.pigeon_name
+          FROM user_players up
+          JOIN players p ON p.player_id = up.player_id
+         WHERE up.user_id = (SELECT user_id FROM users WHERE lower(email) = lower(:email))
+           AND p.tenant_id = :tenant_id
+           AND up.player_id <> :player_id
+           AND up.role IN ('owner','manager')
+         ORDER BY p.pigeon_number
+    """), {"email": user.email, "tenant_id": user.tenant_id, "player_id": user.player_id})
+    alt_rows = res.all()
+    alt_pigeons = [AltPigeon(player_id=r[0], pigeon_number=r[1], pigeon_name=r[2]) for r in alt_rows]
+
+    # All tenants this user belongs to
+    uid_row = (await db.execute(
+        text("SELECT user_id FROM users WHERE lower(email) = lower(:email)"), {"email": user.email}
+    )).first()
+    uid = uid_row[0] if uid_row else None
+    available_tenants = await get_available_tenants(db, uid) if uid else []
 
     debug(f"User context for {user.email}: alt_pigeons={alt_pigeons}, tenants={[t.tenant_id for t in available_tenants]}")
 
@@ -435,31 +459,35 @@ def logout():
 
 
 @router.post("/password-reset", status_code=status.HTTP_200_OK)
-def request_password_reset(payload: PasswordResetRequestIn):
+async def request_password_reset(
+    payload: PasswordResetRequestIn,
+    background: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+):
     email = payload.email.lower().strip()
     debug("password-reset: request received", email=email)
 
     try:
-        with db() as conn, conn.cursor() as cur:
-            cur.execute("SELECT user_id FROM users WHERE lower(email) = %s", (email,))
-            row = cur.fetchone()
-            if not row:
-                info("password-reset: email not found", email=email)
-                return {"ok": True}
-
-            uid = int(row[0])
-            token = make_reset_token(uid)
-            sent_password_reset_email(email, token)
-            info("password-reset: email sent", uid=uid, email=email)
-            return {"ok": True}
-
-    except psycopg.Error as db_exc:
+        res = await db.execute(text("SELECT user_id FROM users WHERE lower(email) = :email"), {"email": email})
+        row = res.first()
+    except SQLAlchemyError as db_exc:
         error("password-reset: DB error", exc=db_exc, email=email)
         raise HTTPException(status_code=500, detail="Failed to process request") from db_exc
 
+    if not row:
+        info("password-reset: email not found", email=email)
+        return {"ok": True}
+
+    uid = int(row[0])
+    token = make_reset_token(uid)
+    # Sent after the response goes out, so the reply doesn't wait on the mail API
+    background.add_task(sent_password_reset_email, email, token)
+    info("password-reset: email queued", uid=uid, email=email)
+    return {"ok": True}
+
 
 @router.post("/password-reset/confirm", status_code=status.HTTP_200_OK)
-def confirm_password_reset(payload: PasswordResetConfirmIn):
+async def confirm_password_reset(payload: PasswordResetConfirmIn, db: AsyncSession = Depends(get_db)):
     debug("In confirm_password_reset")
 
     data = parse_reset_token(payload.token)
@@ -471,35 +499,24 @@ def confirm_password_reset(payload: PasswordResetConfirmIn):
     jti = data["jti"]
 
     try:
-        with db() as conn:
-            ensure_reset_table(conn)
-            with conn.cursor() as cur:
-                if jti_already_used(cur, jti):
-                    warn("password-reset: token jti already used", uid=uid, jti=jti)
-                    raise HTTPException(status_code=401, detail="Reset link already used")
-
-                cur.execute("SELECT email FROM users WHERE user_id = %s", (uid,))
-                row = cur.fetchone()
-                if not row:
-                    raise HTTPException(status_code=401, detail="Invalid reset token")
-                email = row[0]
-
-                new_hash = bcrypt.hash(payload.new_password)
-                cur.execute("UPDATE users SET password_hash = %s WHERE user_id = %s", (new_hash, uid))
-                if cur.rowcount != 1:
-                    warn("password-reset: couldn't update user", uid=uid, jti=jti)
-                    raise HTTPException(status_code=401, detail="Invalid reset token")
-
-                mark_jti_used(cur, jti, uid)
-
-                ctx = select_tenant_context(cur, uid)
-                if not ctx:
-                    raise HTTPException(status_code=403, detail="No tenant/player assigned to this user")
-                set_last_used_at(cur, uid, ctx[3])
-
-            conn.commit()
-
-    except psycopg.Error as db_exc:
+        await ensure_reset_table()  # no-op once startup (or an earlier reset) created it
+        new_hash = await asyncio.to_thread(bcrypt.hash, payload.new_password)
+        res = await db.execute(CONSUME_RESET_SQL, {"uid": uid, "jti": jti, "new_hash": new_hash})
+        email, updated_email = res.one()
+        if email is None:
+            raise HTTPException(status_code=401, detail="Invalid reset token")
+        if updated_email is None:
+            warn("password-reset: token jti already used", uid=uid, jti=jti)
+            raise HTTPException(status_code=401, detail="Reset link already used")
+
+        ctx = await select_tenant_context(db, uid)
+        if not ctx:
+            raise HTTPException(status_code=403, detail="No tenant/player assigned to this user")
+        await set_last_used_at(db, uid, ctx[3])
+
+        await db.commit()
+
+    except SQLAlchemyError as db_exc:
         warn("password-reset: DB error", exc=db_exc, uid=uid, jti=jti)
         raise HTTPException(status_code=500, detail="Failed to reset password") from db_exc
 
@@ -520,7 +537,7 @@ class AuthUser(BaseModel):
     email: EmailStr | None = None
     is_admin: bool = False
 
-def require_user(user: MeOut = Depends(current_user)) -> AuthUser:
+async def require_user(user: MeOut = Depends(current_user)) -> AuthUser:
     return AuthUser(
         player_id=user.player_id,
         pigeon_number=user.pigeon_number,
@@ -529,7 +546,7 @@ def require_user(user: MeOut = Depends(current_user)) -> AuthUser:
         tenant_id=user.tenant_id,
     )
 
-def require_admin(user: MeOut = Depends(current_user)) -> AuthUser:
+async def require_admin(user: MeOut = Depends(current_user)) -> AuthUser:
     if not user.is_admin:
         raise HTTPException(status_code=403, detail="Commissioner access required")
     return AuthUser(
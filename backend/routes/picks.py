@@ -9,7 +9,7 @@ from collections.abc import Iterable
 from datetime import UTC, datetime
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -61,22 +61,28 @@ class PicksBulkIn(BaseModel):
 # =========================
 # Helper queries
 # =========================
+# Lock time and the week's game_ids in one round-trip (no row = week not set up for tenant)
 CHECK_WEEK_SQL = text("""
-    SELECT lock_at
-    FROM tenant_weeks
-    WHERE tenant_id = :tenant_id AND week_number = :week_number
+    SELECT tw.lock_at,
+           ARRAY(SELECT g.game_id FROM games g WHERE g.week_number = tw.week_number) AS game_ids
+    FROM tenant_weeks tw
+    WHERE tw.tenant_id = :tenant_id AND tw.week_number = :week_number
 """)
 
-GAMES_FOR_WEEK_SQL = text("""
-    SELECT game_id
-    FROM games
-    WHERE week_number = :week_number
-""")
-
-UPSERT_PICK_SQL = text("""
-    WITH ins AS (
+# Whole payload in one statement: parallel arrays are unnested (WITH ORDINALITY so the
+# response keeps the request's order). PicksBulkIn already rejects duplicate game_ids.
+UPSERT_PICKS_SQL = text("""
+    WITH input AS (
+        SELECT *
+        FROM unnest(
+            CAST(:game_ids AS bigint[]),
+            CAST(:picked_home AS boolean[]),
+            CAST(:predicted_margin AS int[])
+        ) WITH ORDINALITY AS t(game_id, picked_home, predicted_margin, n)
+    ), ins AS (
         INSERT INTO picks (player_id, game_id, picked_home, predicted_margin)
-        VALUES (:player_id, :game_id, :picked_home, :predicted_margin)
+        SELECT CAST(:player_id AS bigint), game_id, picked_home, predicted_margin
+        FROM input
         ON CONFLICT (player_id, game_id)
         DO UPDATE SET
             picked_home = EXCLUDED.picked_home,
@@ -86,7 +92,9 @@ UPSERT_PICK_SQL = text("""
     )
     SELECT pl.pigeon_number, ins.game_id, ins.picked_home, ins.predicted_margin, ins.created_at
     FROM ins
+    JOIN input ON input.game_id = ins.game_id
     JOIN players pl ON pl.player_id = ins.player_id
+    ORDER BY input.n
 """)
 
 GET_PICKS_FOR_WEEK_SQL = text("""
@@ -99,6 +107,8 @@ GET_PICKS_FOR_WEEK_SQL = text("""
     ORDER BY p.game_id
 """)
 
+_PICKS_ADAPTER = TypeAdapter(list[PickOut])
+
 AUTHZ_SQL = text("""
     SELECT 1
       FROM user_players up
@@ -116,22 +126,19 @@ PLAYER_IN_TENANT_SQL = text("""
 # =========================
 # Utilities
 # =========================
-async def _ensure_week_unlocked(db: AsyncSession, week_number: int, tenant_id: int) -> None:
+async def _ensure_week_open_for_games(
+    db: AsyncSession, week_number: int, tenant_id: int, game_ids: Iterable[int]
+) -> None:
+    """404 if the week isn't set up, 409 if it's locked, 400 if any game_id is from another week."""
     row = (await db.execute(CHECK_WEEK_SQL, {"week_number": week_number, "tenant_id": tenant_id})).first()
     if not row:
         raise HTTPException(status_code=404, detail=f"Week {week_number} not found")
-    (lock_at,) = row
+    lock_at, week_game_ids = row
     now = datetime.now(UTC)
     if lock_at <= now:
         raise HTTPException(status_code=409, detail=f"Week {week_number} is locked")
 
-async def _ensure_all_games_in_week(
-    db: AsyncSession, week_number: int, game_ids: Iterable[int]
-) -> None:
-    if not game_ids:
-        return
-    rows = await db.execute(GAMES_FOR_WEEK_SQL, {"week_number": week_number})
-    valid_ids = {r[0] for r in rows.fetchall()}
+    valid_ids = set(week_game_ids)
     missing = [gid for gid in game_ids if gid not in valid_ids]
     if missing:
         raise HTTPException(
@@ -189,17 +196,7 @@ async def get_my_picks_for_week(
         GET_PICKS_FOR_WEEK_SQL,
         {"player_id": acting_player_id, "tenant_id": me.tenant_id, "week_number": week_number},
     )
-    rows = result.fetchall()
-    return [
-        PickOut(
-            pigeon_number=r[0],
-            game_id=r[1],
-            picked_home=r[2],
-            predicted_margin=r[3],
-            created_at=r[4],
-        )
-        for r in rows
-    ]
+    return _PICKS_ADAPTER.validate_python(result.mappings().all())
 
 
 @router.post(
@@ -217,32 +214,22 @@ async def upsert_picks_bulk(
     """ App-layer guard (DB trigger will also enforce) """
     acting_player_id = await _resolve_acting_player(db, me, player_id)
 
-    await _ensure_week_unlocked(db, payload.week_number, me.tenant_id)
-    await _ensure_all_games_in_week(db, payload.week_number, (p.game_id for p in payload.picks))
+    await _ensure_week_open_for_games(
+        db, payload.week_number, me.tenant_id, (p.game_id for p in payload.picks)
+    )
 
-    out: list[PickOut] = []
-    for p in payload.picks:
-        res = await db.execute(
-            UPSERT_PICK_SQL,
-            {
-                "player_id": acting_player_id,
-                "game_id": p.game_id,
-                "picked_home": p.picked_home,
-                "predicted_margin": p.predicted_margin,
-            },
-        )
-        r = res.first()
-        if r is None:
-            raise HTTPException(status_code=500, detail="Upsert returned no row")
-        out.append(
-            PickOut(
-                pigeon_number=r[0],
-                game_id=r[1],
-                picked_home=r[2],
-                predicted_margin=r[3],
-                created_at=r[4],
-            )
-        )
+    res = await db.execute(
+        UPSERT_PICKS_SQL,
+        {
+            "player_id": acting_player_id,
+            "game_ids": [p.game_id for p in payload.picks],
+            "picked_home": [p.picked_home for p in payload.picks],
+            "predicted_margin": [p.predicted_margin for p in payload.picks],
+        },
+    )
+    out = _PICKS_ADAPTER.validate_python(res.mappings().all())
+    if len(out) != len(payload.picks):
+        raise HTTPException(status_code=500, detail="Upsert did not return every pick")
     await db.commit()
 
     # Andy's external survey only applies to the original tenant (tenant 1)
@@ -21,7 +21,7 @@ Notes:
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -80,6 +80,10 @@ class YtdRow(BaseModel):
     pigeon_name: str
     by_week: list[YtdByWeek]
 
+# Built once; validate a whole result set per call instead of a model per row
+_WEEK_PICKS_ADAPTER = TypeAdapter(list[WeekPicksRow])
+_LEADERBOARD_ADAPTER = TypeAdapter(list[LeaderboardRow])
+
 # =============================================================================
 # SQL
 # =============================================================================
@@ -104,14 +108,15 @@ WEEK_PICKS_SQL = text("""
       predicted_margin,
       home_abbr,
       away_abbr,
-      kickoff_at,
+      -- ISO text built in SQL (same shape as datetime.isoformat() for UTC)
+      to_char(v.kickoff_at AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS"+00:00"') AS kickoff_at,
       status,
       home_score,
       away_score
-    FROM v_week_picks_with_names
+    FROM v_week_picks_with_names v
     WHERE week_number = :week
       AND tenant_id = :tenant_id
-    ORDER BY pigeon_number, kickoff_at, game_id
+    ORDER BY pigeon_number, v.kickoff_at, game_id
 """)
 
 WEEK_LEADERBOARD_SQL = text("""
@@ -194,28 +199,9 @@ async def get_week_picks(
     debug("results: get_week_picks called", user=me.pigeon_number, week=week)
     await _ensure_week_locked(db, week, me.tenant_id)
 
-    rows = (await db.execute(WEEK_PICKS_SQL, {"week": week, "tenant_id": me.tenant_id})).fetchall()
+    rows = (await db.execute(WEEK_PICKS_SQL, {"week": week, "tenant_id": me.tenant_id})).mappings().all()
     info("results: week picks rows", week=week, count=len(rows))
-
-    out: list[WeekPicksRow] = []
-    for r in rows:
-        out.append(
-            WeekPicksRow(
-                pigeon_number=r[0],
-                pigeon_name=r[1],
-                game_id=r[2],
-                week_number=r[3],
-                picked_home=r[4],
-                predicted_margin=r[5],
-                home_abbr=r[6],
-                away_abbr=r[7],
-                kickoff_at=r[8].isoformat(),
-                status=r[9],
-                home_score=r[10],
-                away_score=r[11],
-            )
-        )
-    return out
+    return _WEEK_PICKS_ADAPTER.validate_python(rows)
 
 
 @router.get(
@@ -235,20 +221,9 @@ async def get_week_leaderboard(
     debug("results: get_week_leaderboard called", user=me.pigeon_number, week=week)
     await _ensure_week_locked(db, week, me.tenant_id)
 
-    rows = (await db.execute(WEEK_LEADERBOARD_SQL, {"week": week, "tenant_id": me.tenant_id})).fetchall()
+    rows = (await db.execute(WEEK_LEADERBOARD_SQL, {"week": week, "tenant_id": me.tenant_id})).mappings().all()
     info("results: week leaderboard rows", week=week, count=len(rows))
-
-    return [
-        LeaderboardRow(
-            pigeon_number=r[0],
-            pigeon_name=r[1],
-            week_number=r[2],
-            score=r[3],
-            rank=r[4],
-            points=r[5],
-        )
-        for r in rows
-    ]
+    return _LEADERBOARD_ADAPTER.validate_python(rows)
 
 
 @router.get(
@@ -263,17 +238,6 @@ async def get_all_locked_leaderboards(
     """Return concatenated leaderboard rows for all locked weeks (pigeon_name included)."""
     debug("results: get_all_locked_leaderboards called", user=me.pigeon_number)
 
-    rows = (await db.execute(ALL_LOCKED_LEADERBOARD_SQL, {"tenant_id": me.tenant_id})).fetchall()
+    rows = (await db.execute(ALL_LOCKED_LEADERBOARD_SQL, {"tenant_id": me.tenant_id})).mappings().all()
     info("results: all locked leaderboard rows", count=len(rows))
-
-    return [
-        LeaderboardRow(
-            pigeon_number=r[0],
-            pigeon_name=r[1],
-            week_number=r[2],
-            score=r[3],
-            rank=r[4],
-            points=r[5],
-        )
-        for r in rows
-    ]
+    return _LEADERBOARD_ADAPTER.validate_python(rows)
@@ -4,10 +4,11 @@
 
 from __future__ import annotations
 
+import time
 from datetime import datetime
 
 from fastapi import APIRouter, Depends
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -59,14 +60,42 @@ GAMES_FOR_WEEK_SQL = text("""
     ORDER BY kickoff_at, game_id
 """)
 
+_GAMES_ADAPTER = TypeAdapter(list[GameOut])
+
+# ---------- Current-week cache ----------
+
+# The frontend polls /schedule/current_week, but the answer only changes when a week
+# locks or its games change status. Cache per tenant (per worker) for a few seconds.
+_CURRENT_WEEK_TTL_SECONDS = 10.0
+_current_week_cache: dict[int, tuple[float, CurrentWeek]] = {}
+
+
+def invalidate_current_week(tenant_id: int) -> None:
+    """Drop the cached current week for a tenant; call after changing its lock times."""
+    _current_week_cache.pop(tenant_id, None)
+
 # ---------- Endpoints ----------
 
 
 @router.get("/current_week", response_model=CurrentWeek, summary="Get current live week number")
-async def get_current_week(
+async def get_current_week_cached(
     db: AsyncSession = Depends(get_db),
     me=Depends(require_user),
 ):
+    """
+    get_current_week() for the polling endpoint, reused for up to
+    _CURRENT_WEEK_TTL_SECONDS. Admin guards call get_current_week() directly.
+    """
+    now = time.monotonic()
+    hit = _current_week_cache.get(me.tenant_id)
+    if hit is not None and now - hit[0] < _CURRENT_WEEK_TTL_SECONDS:
+        return hit[1]
+    current = await get_current_week(db, me)
+    _current_week_cache[me.tenant_id] = (now, current)
+    return current
+
+
+async def get_current_week(db: AsyncSession, me) -> CurrentWeek:
     """
     Returns the most recently locked week for the authenticated user's tenant.
     Lock times are per-tenant (tenant_weeks), so auth is required.
@@ -108,17 +137,4 @@ async def get_current_week(
 async def get_games_for_week(week_number: int, db: AsyncSession = Depends(get_db)):
     """ List all games scheduled for a given week """
     result = await db.execute(GAMES_FOR_WEEK_SQL, {"week_number": week_number})
-    rows = result.fetchall()
-    return [
-        GameOut(
-            game_id=r[0],
-            week_number=r[1],
-            kickoff_at=r[2],
-            home_abbr=r[3],
-            away_abbr=r[4],
-            status=r[5],
-            home_score=r[6],
-            away_score=r[7],
-        )
-        for r in rows
-    ]
+    return _GAMES_ADAPTER.validate_python(result.mappings().all())
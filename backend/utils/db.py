@@ -10,11 +10,23 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 
 from .settings import get_settings
 
+_settings = get_settings()
+
 engine = create_async_engine(
-    get_settings().sqlalchemy_async_url(),
+    _settings.sqlalchemy_async_url(),
     future=True,
     echo=False,
     pool_pre_ping=True,
+    # Sized for user traffic plus long admin sessions (bulk email, XLSX import) per worker;
+    # keep pool_size + max_overflow under the server's max_connections / worker count.
+    pool_size=_settings.db_pool_size,
+    max_overflow=_settings.db_max_overflow,
+    pool_timeout=30,
+    pool_recycle=1800,  # drop connections before idle-timeouts on managed Postgres/proxies
+    # The dialect's per-connection prepared-statement LRU defaults to 100 entries; the routes,
+    # views and scheduler jobs use more distinct statements than that, so hot ones got evicted
+    # and re-prepared. (Behind PgBouncer in transaction mode this must be 0 instead.)
+    connect_args={"prepared_statement_cache_size": 500},
 )
 AsyncSessionLocal = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)  # pylint: disable=C0103
 
@@ -17,17 +17,19 @@ We:
 - Upsert picks
 """
 
-# pylint: disable=line-too-long, too-many-locals, too-many-branches, broad-exception-caught
+# pylint: disable=line-too-long, too-many-locals, too-many-branches
 
 from __future__ import annotations
 
 import logging
+import math
 import os
+import re
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any
 
-from openpyxl import load_workbook
-
 from backend.utils.settings import get_settings
 
 # ---------------------------
@@ -38,36 +40,35 @@ logging.basicConfig(level=getattr(logging, LOG_LEVEL, logging.INFO),
                     format="%(levelname)s %(message)s")
 log = logging.getLogger("picks_import")
 
+# Opt-in Rust-backed reader (pip install python-calamine); openpyxl stays the default
+FAST_READER = os.getenv("PICKS_IMPORT_FAST", "") == "1"
+
 def import_picks_pivot_xlsx_with_engine(
     xlsx_path: str, only_week: int | None = None, tenant_id: int = 1
 ) -> int:
     """
     Open a fresh psycopg connection and import picks from the given XLSX.
-    Scoped to tenant_id (default 1, the legacy Andy pool). The bypass_lock session
-    variable is set so the pick-lock trigger is skipped for historical imports.
+    Scoped to tenant_id (default 1, the legacy Andy pool). The whole import runs in one
+    transaction with bypass_lock set LOCAL so the pick-lock trigger is skipped for
+    historical imports.
     """
     import psycopg as _psycopg  # pylint: disable=import-outside-toplevel
     cfg = get_settings().psycopg_kwargs()
-    with _psycopg.connect(**cfg) as conn:  # pylint: disable=no-member
-        with conn.cursor() as cur:
-            cur.execute("SET app.bypass_lock = 'on';")
-        try:
-            result = import_picks_pivot_xlsx(
-                xlsx_path=xlsx_path,
-                conn=conn,
-                tenant_id=tenant_id,
-                only_week=only_week,
-            )
-        finally:
-            with conn.cursor() as cur:
-                cur.execute("RESET app.bypass_lock;")
-    return result
+    with _psycopg.connect(**cfg) as conn, conn.transaction():  # pylint: disable=no-member
+        conn.execute("SET LOCAL app.bypass_lock = 'on';")
+        return import_picks_pivot_xlsx(
+            xlsx_path=xlsx_path,
+            conn=conn,
+            tenant_id=tenant_id,
+            only_week=only_week,
+        )
 
 # ---------------------------
 # Spreadsheet → ESPN aliases
 # (extend as needed)
 # ---------------------------
-TEAM_ALIASES: dict[str, str] = {
+# Keys are stripped, upper-cased labels; read-only so an import can't mutate it mid-run
+TEAM_ALIASES: MappingProxyType[str, str] = MappingProxyType({
     # Common mismatches
     "AZ": "ARI",
     "ARZ": "ARI",
@@ -81,12 +82,7 @@ TEAM_ALIASES: dict[str, str] = {
     "STL": "LAR",
     # Ambiguities (keep conservative)
     # "LA": "LAR",  # <- leave commented; ambiguous between LAR/LAC
-}
-
-def _norm_team(label: str) -> str:
-    """Normalize a spreadsheet team label to ESPN/DB canonical code."""
-    key = (label or "").strip().upper()
-    return TEAM_ALIASES.get(key, key)
+})
 
 
 @dataclass
@@ -96,26 +92,77 @@ class _PlayerCol:
     pigeon_name: str
 
 
-def _is_blank(v: Any) -> bool:
-    if v is None:
-        return True
-    return bool(isinstance(v, str) and v.strip() == "")
+def _float_to_int(f: float) -> int | None:
+    """Whole-number float (within 1e-9) to int; None for fractions, NaN and infinities."""
+    if not math.isfinite(f):
+        return None
+    i = int(f)
+    return i if abs(f - i) < 1e-9 else None
+
+
+_NUMERIC_RE = re.compile(r"-?\d+(?:\.\d*)?")
 
 
 def _to_int_safe(v: Any) -> int | None:
     """Parse Excel cell to int; accepts strings like ' 7 ' or '+7' and floats like 7.0."""
-    if _is_blank(v):
+    # Fast paths: openpyxl hands back native numbers for numeric cells
+    if v is None or isinstance(v, bool):
         return None
-    s = str(v).strip().replace("+", "")
-    try:
-        f = float(s)
-        i = int(f)
-        return i if abs(f - i) < 1e-9 else None
-    except Exception:  # noqa: BLE001
+    if isinstance(v, int):
+        return v
+    if isinstance(v, float):
+        return _float_to_int(v)
+    if not isinstance(v, str):
+        return None
+    s = v.strip().removeprefix("+")
+    # Names, team codes and blanks fail the regex instead of raising inside float()
+    if not _NUMERIC_RE.fullmatch(s):
+        return None
+    return _float_to_int(float(s))
+
+
+_HEADER_LAST_ROW = 14                           # header detection scans rows 2..14
+_END_LABELS = frozenset({"DIST", "CONSENSUS"})  # team-label column sentinels ending the data
+_LABEL_COL = 3                                  # team labels live in column 'C'
+_MAX_BLANK_RUN = 50                             # consecutive blank rows treated as end of data
+
+
+def _read_sheet_rows(sheet_rows: Iterable[Sequence[Any]], *, label_col: int = _LABEL_COL) -> list[Sequence[Any]]:
+    """
+    Buffer a sheet's value rows (from row 1, column A), keeping only what the importer
+    reads: the header window, then rows up to and including the first DIST/CONSENSUS
+    label after it. With a streaming source, everything below that is never parsed.
+    A sheet without a sentinel ends after _MAX_BLANK_RUN blank rows, so a stale
+    dimension (e.g. A1:BK1048501) can't make us walk a million empty rows.
+    """
+    rows: list[Sequence[Any]] = []
+    blank_run = 0
+    for values in sheet_rows:
+        rows.append(values)
+        if len(rows) <= _HEADER_LAST_ROW:
+            continue
+        if all(v is None or v == "" for v in values):
+            blank_run += 1
+            if blank_run >= _MAX_BLANK_RUN:
+                break
+            continue
+        blank_run = 0
+        if label_col <= len(values):
+            v = values[label_col - 1]
+            if v is not None and str(v).strip().upper() in _END_LABELS:
+                break
+    return rows
+
+
+def _cell(rows: list[Sequence[Any]], row: int, col: int) -> Any:
+    """1-based cell lookup into a sheet's value rows; None outside the used range."""
+    if row > len(rows):
         return None
+    values = rows[row - 1]
+    return values[col - 1] if col <= len(values) else None
 
 
-def _detect_header(ws) -> tuple[int, int, int, int]:
+def _detect_header(rows: list[Sequence[Any]]) -> tuple[int, int, int, int]:
     """
     Return (name_row_idx, number_row_idx, first_player_col, last_player_col).
     Detect row with many ints as the player-number row; names are row-1.
@@ -125,17 +172,13 @@ def _detect_header(ws) -> tuple[int, int, int, int]:
     first_col = None
     last_col = None
 
-    for row in range(2, 15):  # look in first few rows
-        ints_here = []
-        for col in range(1, ws.max_column + 1):
-            val = _to_int_safe(ws.cell(row=row, column=col).value)
-            if val is not None:
-                ints_here.append(col)
+    for row in range(2, min(_HEADER_LAST_ROW, len(rows)) + 1):  # look in first few rows
+        ints_here = [col for col, v in enumerate(rows[row - 1], start=1) if _to_int_safe(v) is not None]
         if len(ints_here) > max_ints and len(ints_here) >= 10:
             max_ints = len(ints_here)
             number_row = row
-            first_col = min(ints_here)
-            last_col = max(ints_here)
+            first_col = ints_here[0]
+            last_col = ints_here[-1]
 
     if number_row is None or first_col is None or last_col is None:
         raise RuntimeError("Could not detect player number row / columns.")
@@ -144,11 +187,11 @@ def _detect_header(ws) -> tuple[int, int, int, int]:
     return name_row, number_row, first_col, last_col
 
 
-def _collect_players(ws, name_row: int, number_row: int, c1: int, c2: int) -> list[_PlayerCol]:
+def _collect_players(rows: list[Sequence[Any]], name_row: int, number_row: int, c1: int, c2: int) -> list[_PlayerCol]:
     players: list[_PlayerCol] = []
     for col in range(c1, c2 + 1):
-        nm = ws.cell(row=name_row, column=col).value
-        pn = _to_int_safe(ws.cell(row=number_row, column=col).value)
+        nm = _cell(rows, name_row, col)
+        pn = _to_int_safe(_cell(rows, number_row, col))
         if pn is None:
             continue
         name = (str(nm).strip() if nm is not None else f"Pigeon {pn}") or f"Pigeon {pn}"
@@ -156,70 +199,100 @@ def _collect_players(ws, name_row: int, number_row: int, c1: int, c2: int) -> li
     return players
 
 
-def _iter_team_rows(ws, start_row: int, *, label_col: int = 1) -> list[str]:
+def _iter_team_rows(rows: list[Sequence[Any]], start_row: int, *, label_col: int = 1) -> list[str]:
     """
-    Return a list of team labels starting at start_row (normalized).
+    Return a list of team labels starting at start_row, upper-cased and mapped through TEAM_ALIASES.
     - label_col: 1-based column index holding the team label (e.g., 3 for column 'C').
     Stops when encountering 'DIST' or 'CONSENSUS'.
     Skips fully blank rows.
     """
     labels: list[str] = []
-    max_r = ws.max_row or 0
 
-    for r in range(start_row, max_r + 1):
-        v = ws.cell(row=r, column=label_col).value
+    for r in range(start_row, len(rows) + 1):
+        v = _cell(rows, r, label_col)
         if v is None or str(v).strip() == "":
             continue
         label = str(v).strip().upper()
-        if label in {"DIST", "CONSENSUS"}:
+        if label in _END_LABELS:
             break
-        labels.append(_norm_team(label))  # <-- normalize here
+        labels.append(TEAM_ALIASES.get(label, label))  # ESPN/DB canonical code
     return labels
 
 
-def _find_game_id(cur, week: int, t1: str, t2: str) -> tuple[int, str, str] | None:
+_GameKey = tuple[int, frozenset[str]]
+
+
+def _load_games(cur, weeks: list[int]) -> dict[_GameKey, tuple[int, str, str]]:
     """
-    Attempt to find the game for (t1, t2) in any order.
-    Returns (game_id, home_abbr, away_abbr) if found.
+    Fetch every game for the given weeks in one query.
+    Keyed by (week, {team, team}) so a spreadsheet pair matches in either order;
+    values are (game_id, home_abbr, away_abbr).
     """
     cur.execute(
-        """
-        SELECT game_id, home_abbr, away_abbr
-        FROM games
-        WHERE week_number = %s
-          AND (
-                (home_abbr = %s AND away_abbr = %s) OR
-                (home_abbr = %s AND away_abbr = %s)
-              )
-        """,
-        (week, t1, t2, t2, t1),
+        "SELECT game_id, week_number, home_abbr, away_abbr FROM games WHERE week_number = ANY(%s)",
+        (weeks,),
     )
-    row = cur.fetchone()
-    if not row:
-        return None
-    return int(row[0]), row[1], row[2]
-
+    return {
+        (int(week), frozenset((home, away))): (int(game_id), home, away)
+        for game_id, week, home, away in cur.fetchall()
+    }
+
+
+# Per-transaction staging table for COPY; merged into picks with one INSERT ... SELECT.
+_CREATE_PICKS_STAGE_SQL = """
+    CREATE TEMP TABLE IF NOT EXISTS picks_stage (
+      player_id        BIGINT  NOT NULL,
+      game_id          BIGINT  NOT NULL,
+      picked_home      BOOLEAN NOT NULL,
+      predicted_margin INT     NOT NULL
+    ) ON COMMIT DROP
+"""
 
-def _upsert_pick(cur, player_id: int, game_id: int, picked_home: bool, margin: int) -> None:
-    cur.execute(
-        """
-        INSERT INTO picks (player_id, game_id, picked_home, predicted_margin)
-        VALUES (%s, %s, %s, %s)
-        ON CONFLICT (player_id, game_id)
-        DO UPDATE SET picked_home = EXCLUDED.picked_home,
-                      predicted_margin = EXCLUDED.predicted_margin,
-                      created_at = now()
-        """,
-        (player_id, game_id, picked_home, margin),
+_MERGE_PICKS_STAGE_SQL = """
+    WITH staged AS (
+      DELETE FROM picks_stage
+      RETURNING player_id, game_id, picked_home, predicted_margin
     )
+    INSERT INTO picks (player_id, game_id, picked_home, predicted_margin)
+    SELECT player_id, game_id, picked_home, predicted_margin FROM staged
+    ON CONFLICT (player_id, game_id)
+    DO UPDATE SET picked_home = EXCLUDED.picked_home,
+                  predicted_margin = EXCLUDED.predicted_margin,
+                  created_at = now()
+    -- Re-imports mostly restate existing picks; leave those rows (and created_at) alone
+    WHERE picks.picked_home IS DISTINCT FROM EXCLUDED.picked_home
+       OR picks.predicted_margin IS DISTINCT FROM EXCLUDED.predicted_margin
+"""
 
 
-def import_picks_pivot_xlsx(*, xlsx_path: str, conn, max_week: int | None = None, only_week: int | None = None, tenant_id: int = 1) -> int:
+def _upsert_picks(cur, picks: dict[tuple[int, int], tuple[bool, int]]) -> None:
+    """
+    Upsert {(player_id, game_id): (picked_home, margin)} via COPY into a staging
+    table plus a single merge statement. Keyed by the picks PK so the merge never
+    touches the same row twice.
+    """
+    if not picks:
+        return
+    cur.execute(_CREATE_PICKS_STAGE_SQL)
+    with cur.copy("COPY picks_stage (player_id, game_id, picked_home, predicted_margin) FROM STDIN") as copy:
+        for (player_id, game_id), (picked_home, margin) in picks.items():
+            copy.write_row((player_id, game_id, picked_home, margin))
+    # Same text every flush: prepare on first use rather than after psycopg's default 5
+    # executions. Scoped to this statement so pooled CLI connections keep the default.
+    cur.execute(_MERGE_PICKS_STAGE_SQL, prepare=True)
+
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def import_picks_pivot_xlsx(*, xlsx_path: str, conn, max_week: int | None = None, only_week: int | None = None, tenant_id: int = 1, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
     """
     Import a pivoted XLSX with one sheet per week (title like 'picks wk N').
     Uses alias normalization for team codes and logs detailed skip reasons.
     Players must already exist in the DB for the given tenant; unknown pigeon_numbers
     are skipped with a warning rather than created.
+    batch_size caps how many picks are buffered before a COPY + merge flush.
+    Runs in the caller's transaction and never commits; the caller owns COMMIT.
     """
     # Build pigeon_number -> player_id map for this tenant
     with conn.cursor() as cur:
@@ -227,37 +300,88 @@ def import_picks_pivot_xlsx(*, xlsx_path: str, conn, max_week: int | None = None
         pigeon_to_player: dict[int, int] = {row[0]: row[1] for row in cur.fetchall()}
     log.info("[xlsx] Loaded %d player mappings for tenant %d", len(pigeon_to_player), tenant_id)
 
-    wb = load_workbook(xlsx_path, data_only=True)
-    processed = 0
+    if FAST_READER:
+        try:
+            from python_calamine import CalamineWorkbook  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            log.warning("[xlsx] PICKS_IMPORT_FAST=1 but python-calamine is not installed; using openpyxl.")
+        else:
+            cwb = CalamineWorkbook.from_path(xlsx_path)
+            try:
+                # skip_empty_area=False keeps row 1 / column A anchored like openpyxl;
+                # blank cells come back as "" and numbers as floats, both handled by _to_int_safe
+                return _import_workbook(
+                    cwb.sheet_names,
+                    lambda title: cwb.get_sheet_by_name(title).to_python(skip_empty_area=False),
+                    conn, pigeon_to_player, max_week=max_week, only_week=only_week,
+                    tenant_id=tenant_id, batch_size=batch_size)
+            finally:
+                cwb.close()
+
+    # openpyxl is imported here rather than at module top: routes/admin.py imports this
+    # module, and only the (rare) XLSX upload should pay for loading it at server boot.
+    from openpyxl import load_workbook  # pylint: disable=import-outside-toplevel
+
+    # Read-only mode streams the sheet XML instead of building the full cell DOM
+    wb = load_workbook(xlsx_path, read_only=True, data_only=True, keep_links=False)
+    try:
+        return _import_workbook(
+            wb.sheetnames,
+            lambda title: wb[title].iter_rows(values_only=True),
+            conn, pigeon_to_player, max_week=max_week, only_week=only_week,
+            tenant_id=tenant_id, batch_size=batch_size)
+    finally:
+        wb.close()
+
 
-    for ws in wb.worksheets:
-        title = (ws.title or "").strip().lower()
+def _import_workbook(sheet_titles: list[str], sheet_rows: Callable[[str], Iterable[Sequence[Any]]], conn, pigeon_to_player: dict[int, int], *, max_week: int | None, only_week: int | None, tenant_id: int, batch_size: int) -> int:
+    """
+    Reader-agnostic import: sheet_rows(title) yields that sheet's value rows from A1.
+    Filters sheet_titles down to the wanted week sheets before reading any rows.
+    """
+    # Pick out the week sheets from their titles before reading any of them
+    week_sheets = []
+    for sheet_title in sheet_titles:
+        title = (sheet_title or "").strip().lower()
         if not title.startswith("picks wk"):
             continue
 
         # parse week number from title
         try:
             week = int(title.split("wk", 1)[1].strip())
-        except Exception:  # noqa: BLE001
-            log.warning("[xlsx] Skipping sheet '%s' (week number parse failed).", ws.title)
+        except ValueError:
+            log.warning("[xlsx] Skipping sheet '%s' (week number parse failed).", sheet_title)
             continue
         if only_week is not None and week != only_week:
             continue
         if max_week is not None and week > max_week:
             continue
+        week_sheets.append((sheet_title, week))
+
+    # All games for those weeks in one round-trip instead of a lookup per team pair
+    with conn.cursor() as cur:
+        games = _load_games(cur, sorted({week for _, week in week_sheets}))
+
+    processed = 0
 
-        log.info("[xlsx] Processing '%s' as Week %d…", ws.title, week)
+    for sheet_title, week in week_sheets:
+        log.info("[xlsx] Processing '%s' as Week %d…", sheet_title, week)
+
+        # One streaming pass over the sheet; random access in read-only mode re-parses it
+        rows = _read_sheet_rows(sheet_rows(sheet_title))
 
         # Header detection
-        name_row, number_row, c1, c2 = _detect_header(ws)
+        name_row, number_row, c1, c2 = _detect_header(rows)
         log.debug("[xlsx] Header: name_row=%s, number_row=%s, cols=%s..%s", name_row, number_row, c1, c2)
-        players = _collect_players(ws, name_row, number_row, c1, c2)
+        players = _collect_players(rows, name_row, number_row, c1, c2)
         if not players:
-            log.warning("[warn] No player columns with numbers detected on sheet '%s'", ws.title)
+            log.warning("[warn] No player columns with numbers detected on sheet '%s'", sheet_title)
             continue
 
+        player_cols = [p.col_idx for p in players]
+
         # Team rows (normalized)
-        team_labels = _iter_team_rows(ws, number_row + 1, label_col=3)
+        team_labels = _iter_team_rows(rows, number_row + 1, label_col=_LABEL_COL)
         log.debug("[xlsx] First labels sample: %s", team_labels[:8])
 
         # Skip counters
@@ -266,9 +390,10 @@ def import_picks_pivot_xlsx(*, xlsx_path: str, conn, max_week: int | None = None
             "no_game_match": 0,
             "both_blank": 0,
             "both_filled": 0,
-            "non_int": 0,
         }
+        sheet_picks: dict[tuple[int, int], tuple[bool, int]] = {}
         sheet_count = 0
+        cur = conn.cursor()
 
         i = 0
         while i < len(team_labels):
@@ -279,21 +404,22 @@ def import_picks_pivot_xlsx(*, xlsx_path: str, conn, max_week: int | None = None
             t_top = team_labels[i]     # usually AWAY (normalized)
             t_bot = team_labels[i + 1] # usually HOME (normalized)
 
-            # Pre-scan: which players actually have numbers for this pair?
-            players_with_numbers = []
-            for p in players:
-                v_top = ws.cell(row=number_row + 1 + i, column=p.col_idx).value
-                v_bot = ws.cell(row=number_row + 1 + i + 1, column=p.col_idx).value
-                top_int = _to_int_safe(v_top)
-                bot_int = _to_int_safe(v_bot)
-                if (top_int is not None) ^ (bot_int is not None):
-                    players_with_numbers.append((p, top_int if top_int is not None else bot_int))
+            # Parse the pair's two rows once into parallel per-player arrays; shared by the
+            # miss report and the writes
+            r_top = number_row + 1 + i
+            tops = [_to_int_safe(_cell(rows, r_top, col)) for col in player_cols]
+            bots = [_to_int_safe(_cell(rows, r_top + 1, col)) for col in player_cols]
 
             # DB game match (in any order)
-            cur = conn.cursor()
-            found = _find_game_id(cur, week, t_top, t_bot)
+            found = games.get((week, frozenset((t_top, t_bot))))
             if not found:
                 skips["no_game_match"] += 1
+                # Which players actually had numbers for this pair?
+                players_with_numbers = [
+                    (p, top_int if top_int is not None else bot_int)
+                    for p, top_int, bot_int in zip(players, tops, bots, strict=True)
+                    if (top_int is not None) ^ (bot_int is not None)
+                ]
                 if players_with_numbers:
                     # These picks could not be imported due to team-code mismatch
                     who = ", ".join([f"#{p.pigeon_number}({m})" for (p, m) in players_with_numbers[:12]])
@@ -310,29 +436,20 @@ def import_picks_pivot_xlsx(*, xlsx_path: str, conn, max_week: int | None = None
             game_id, home_abbr, _ = found
 
             # For each player, write pick if exactly one of the two cells has an int
-            for p in players:
-                v_top = ws.cell(row=number_row + 1 + i, column=p.col_idx).value
-                v_bot = ws.cell(row=number_row + 1 + i + 1, column=p.col_idx).value
-                top_int = _to_int_safe(v_top)
-                bot_int = _to_int_safe(v_bot)
-
-                if top_int is None and bot_int is None:
-                    skips["both_blank"] += 1
-                    continue
-                if top_int is not None and bot_int is not None:
+            for p, top_int, bot_int in zip(players, tops, bots, strict=True):
+                if top_int is None:
+                    if bot_int is None:
+                        skips["both_blank"] += 1
+                        continue
+                    margin, team_with_pick = bot_int, t_bot
+                elif bot_int is not None:
                     skips["both_filled"] += 1
                     log.debug("[ambig] Week %d game_id=%s player #%s had numbers on both rows (%s & %s).",
                               week, game_id, p.pigeon_number, top_int, bot_int)
                     continue
+                else:
+                    margin, team_with_pick = top_int, t_top
 
-                margin = top_int if top_int is not None else bot_int
-                if margin is None:
-                    skips["non_int"] += 1
-                    log.debug("[nonint] Week %d game_id=%s player #%s had non-int value(s): top=%r bot=%r",
-                              week, game_id, p.pigeon_number, v_top, v_bot)
-                    continue
-
-                team_with_pick = t_top if top_int is not None else t_bot
                 picked_home = team_with_pick == home_abbr
 
                 player_id = pigeon_to_player.get(p.pigeon_number)
@@ -340,12 +457,18 @@ def import_picks_pivot_xlsx(*, xlsx_path: str, conn, max_week: int | None = None
                     log.warning("[xlsx] pigeon_number=%s not found in tenant %d, skipping pick",
                                 p.pigeon_number, tenant_id)
                     continue
-                _upsert_pick(cur, player_id, game_id, picked_home, margin)
-                sheet_count += 1
+                sheet_picks[(player_id, game_id)] = (picked_home, margin)
+                if len(sheet_picks) >= batch_size:
+                    _upsert_picks(cur, sheet_picks)
+                    sheet_count += len(sheet_picks)
+                    sheet_picks.clear()
 
-            conn.commit()
             i += 2
 
+        # COPY + merge whatever is left
+        _upsert_picks(cur, sheet_picks)
+        sheet_count += len(sheet_picks)
+        cur.close()
         log.info("[xlsx] Week %d: processed %d player-pick cells. Skips=%s", week, sheet_count, skips)
         processed += sheet_count
 
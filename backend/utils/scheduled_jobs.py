@@ -65,9 +65,12 @@ async def get_all_player_emails(
     """
     Return distinct emails for users mapped to players.
     - If player_ids is None: all mapped users.
-    - If provided: only users mapped to those players.
+    - If provided: only users mapped to those players (an empty list matches nobody).
     - include_viewers=False will exclude viewer-only accounts.
     """
+    if player_ids is not None and not player_ids:
+        return []
+
     base_sql = """
         SELECT DISTINCT lower(u.email) AS email
           FROM user_players up
@@ -77,7 +80,7 @@ async def get_all_player_emails(
     params = {}
     filters = []
 
-    if player_ids:
+    if player_ids is not None:
         filters.append("up.player_id IN :nums")
         params["nums"] = tuple({int(n) for n in player_ids})
     if not include_viewers:
@@ -323,6 +326,8 @@ async def run_email_tue_warn(session: AsyncSession) -> dict[str, Any]:
             if lock_at_raw else "the upcoming deadline"
         )
 
+        if not player_ids:
+            continue
         emails = await get_all_player_emails(session, player_ids)
         if not emails:
             continue
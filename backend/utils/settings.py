@@ -56,6 +56,8 @@ class Settings:
     pg_db: str
     pg_user: str
     pg_password: str  # may be blank in dev
+    db_pool_size: int        # API async engine: connections kept open per worker
+    db_max_overflow: int     # extra connections allowed under burst (closed when returned)
 
     # JWT & origins
     jwt_secret: str
@@ -114,6 +116,8 @@ def get_settings() -> Settings:
         pg_db=_req("POSTGRES_DB"),
         pg_user=_req("POSTGRES_USER"),
         pg_password=os.getenv("POSTGRES_PASSWORD", ""),
+        db_pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+        db_max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
         jwt_secret=_req("JWT_SECRET"),
         jwt_alg=os.getenv("JWT_ALG", "HS256"),
         api_origin=os.getenv("API_ORIGIN", "http://localhost:8000"),
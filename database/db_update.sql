@@ -105,3 +105,17 @@ SELECT tw.tenant_id, tw.week_number, tw.lock_at,
   JOIN weeks w ON w.week_number = tw.week_number
  WHERE tw.lock_at <> w.default_lock_at
  ORDER BY tw.tenant_id, tw.week_number;
+
+-- -------------------------------------------------------------
+-- Indexes for admin roster and lock-time lookups (also in schema.sql).
+-- user_players' PK is (user_id, player_id), so lookups by player_id alone
+-- (roster listing, assignment replacement, membership repair) could only use
+-- the owner-only partial index. games gets (week_number, kickoff_at) for the
+-- first-kickoff-of-week check in PATCH /admin/weeks/{week}/lock.
+-- The lower(email) lookups already use uniq_users_email_lower.
+-- Both tables are small (hundreds of rows), so a plain CREATE INDEX is fine
+-- and it also works through `cli run-sql`, which runs in one transaction.
+-- Idempotent -- safe to run more than once.
+-- -------------------------------------------------------------
+CREATE INDEX IF NOT EXISTS ix_user_players_player ON user_players (player_id) INCLUDE (role);
+CREATE INDEX IF NOT EXISTS ix_games_week_kickoff ON games (week_number, kickoff_at);
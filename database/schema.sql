@@ -33,6 +33,8 @@ CREATE TABLE IF NOT EXISTS games (
 
 CREATE INDEX IF NOT EXISTS ix_games_week_status ON games (week_number, status);
 CREATE INDEX IF NOT EXISTS ix_games_kickoff     ON games (kickoff_at);
+-- First kickoff per week (lock-time validation) and per-week kickoff ordering
+CREATE INDEX IF NOT EXISTS ix_games_week_kickoff ON games (week_number, kickoff_at);
 
 -- === TENANTS ===
 CREATE TABLE IF NOT EXISTS tenants (
@@ -91,6 +93,8 @@ CREATE TABLE IF NOT EXISTS user_players (
 CREATE UNIQUE INDEX IF NOT EXISTS uniq_player_single_owner
   ON user_players(player_id)
   WHERE role = 'owner';
+-- The PK leads with user_id; roster/admin lookups go by player_id (all roles)
+CREATE INDEX IF NOT EXISTS ix_user_players_player ON user_players (player_id) INCLUDE (role);
 
 -- === TENANT MEMBERSHIP ===
 -- One row per (tenant, user). Every member must have a player (primary_player_id NOT NULL).
@@ -0,0 +1,70 @@
+"""
+Unit tests for the pure parsing helpers in backend/utils/import_picks_xlsx.py.
+
+The workbook is read into plain value-row tuples before any of these helpers run,
+so they can be exercised without openpyxl files, a DB, or network access.
+"""
+
+import pytest
+
+from backend.utils.import_picks_xlsx import (
+    _detect_header,
+    _read_sheet_rows,
+    _to_int_safe,
+)
+
+# ── _to_int_safe ──────────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (7, 7),
+        (7.0, 7),
+        (" 7 ", 7),
+        ("+7", 7),
+        ("7.0", 7),
+        (-3, -3),
+    ],
+)
+def test_to_int_safe_accepts_whole_numbers(value, expected):
+    assert _to_int_safe(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [None, "", "  ", "+", "x", 7.5, True, float("nan"), float("inf"), "inf"],
+)
+def test_to_int_safe_rejects_blanks_fractions_and_non_numbers(value):
+    assert _to_int_safe(value) is None
+
+
+# ── _detect_header ────────────────────────────────────────────────────────────
+
+def test_detect_header_finds_number_row_and_player_columns():
+    names = (None, None, "Team", *[f"Pigeon {n}" for n in range(1, 13)])
+    numbers = (None, None, None, *[str(n) for n in range(1, 13)])
+    picks = (None, None, "PHI", *([3, None] * 6))
+    rows = [("picks wk 1",), names, numbers, picks]
+
+    assert _detect_header(rows) == (2, 3, 4, 15)
+
+
+def test_detect_header_requires_ten_numbered_columns():
+    rows = [("picks wk 1",), ("names",), (None, *range(1, 10))]
+
+    with pytest.raises(RuntimeError):
+        _detect_header(rows)
+
+
+# ── _read_sheet_rows ──────────────────────────────────────────────────────────
+
+def test_read_sheet_rows_stops_at_sentinel_label():
+    rows = [(None, None, f"T{n}") for n in range(20)] + [(None, None, "dist"), (None, None, "NE")]
+
+    assert _read_sheet_rows(iter(rows))[-1] == (None, None, "dist")
+
+
+def test_read_sheet_rows_stops_after_long_blank_run():
+    rows = [(None, None, "PHI")] * 20 + [(None, None, None)] * 1_000_000
+
+    assert len(_read_sheet_rows(iter(rows))) == 20 + 50
@@ -0,0 +1,55 @@
+"""
+Tests for the Tuesday missing-picks reminder in backend/utils/scheduled_jobs.py.
+
+Uses a scripted stand-in for AsyncSession so the "nobody is missing picks" case
+can be exercised without arranging a fully-picked week in the test DB.
+"""
+
+import asyncio
+from typing import cast
+from unittest.mock import patch
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.utils.scheduled_jobs import get_all_player_emails, run_email_tue_warn
+
+
+class _FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+    def fetchall(self):
+        return self._rows
+
+
+class _ScriptedSession:
+    """Returns the queued row lists in order, one per execute() call."""
+
+    def __init__(self, *results):
+        self._results = list(results)
+        self.calls = 0
+
+    async def execute(self, *_args, **_kwargs):
+        self.calls += 1
+        return _FakeResult(self._results.pop(0))
+
+
+def test_get_all_player_emails_empty_list_matches_nobody():
+    session = _ScriptedSession()
+    emails = asyncio.run(get_all_player_emails(cast(AsyncSession, session), []))
+    assert emails == []
+    assert session.calls == 0
+
+
+def test_tue_warn_sends_nothing_when_no_picks_missing():
+    # tenants query, then the (empty) missing-picks query for that tenant
+    session = _ScriptedSession([(1, "Test League")], [])
+    with patch("backend.utils.scheduled_jobs.send_bulk_email_bcc") as send:
+        result = asyncio.run(run_email_tue_warn(cast(AsyncSession, session)))
+
+    send.assert_not_called()
+    assert result["recipients"] == 0
+    assert session.calls == 2